@@ -1,5 +1,7 @@
 import heapq
+import mmap
 import random
+import struct
 
 def crear_laberinto(filas, columnas, densidad_obstaculos=0.3):
     """
@@ -32,71 +34,253 @@ def heuristica(a, b):
     """
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def a_estrella(laberinto, inicio, salida):
+class Rejilla:
     """
-    Implementación del algoritmo de búsqueda A* para encontrar el camino más corto.
+    Laberinto guardado en un arreglo plano de bytes (1 = obstáculo, 0 = libre)
+    con un borde de paredes alrededor. Gracias al borde, los vecinos de la celda
+    i son i±1 e i±ancho sin revisar límites.
+    'celdas' puede ser cualquier buffer indexable (bytearray, mmap, ...).
     """
-    filas, columnas = len(laberinto), len(laberinto[0])
-    
-    # Nodos vecinos (movimientos posibles: arriba, abajo, izquierda, derecha)
-    vecinos = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    def __init__(self, filas, columnas, celdas=None):
+        self.filas = filas
+        self.columnas = columnas
+        self.ancho = columnas + 2
+        if celdas is None:
+            # Todo libre salvo el borde
+            fila = b"\x01" + bytes(columnas) + b"\x01"
+            borde = b"\x01" * self.ancho
+            celdas = bytearray(borde + fila * filas + borde)
+        self.celdas = celdas
 
-    # open_set es una cola de prioridad para los nodos por visitar.
-    # Se almacena como (f_score, posicion_actual).
-    open_set = []
-    heapq.heappush(open_set, (0, inicio))
+    @classmethod
+    def desde_lista(cls, laberinto):
+        """Convierte el formato de crear_laberinto (listas de '0'/'1')."""
+        filas, columnas = len(laberinto), len(laberinto[0])
+        a_bytes = bytes.maketrans(b"01", b"\x00\x01")
+        borde = b"\x01" * (columnas + 2)
+        partes = [borde]
+        for fila in laberinto:
+            partes.append(b"\x01" + "".join(fila).encode().translate(a_bytes) + b"\x01")
+        partes.append(borde)
+        return cls(filas, columnas, bytearray(b"".join(partes)))
 
-    # Diccionario para reconstruir el camino. Mapea un nodo a su predecesor.
-    vino_de = {}
+    def indice(self, pos):
+        """(fila, columna) -> índice plano."""
+        return (pos[0] + 1) * self.ancho + pos[1] + 1
 
-    # g_score: costo del camino desde el inicio hasta el nodo actual.
-    # Se inicializa con infinito para todos los nodos.
-    g_score = { (f, c): float('inf') for f in range(filas) for c in range(columnas) }
-    g_score[inicio] = 0
+    def posicion(self, i):
+        """Índice plano -> (fila, columna)."""
+        f, c = divmod(i, self.ancho)
+        return (f - 1, c - 1)
 
-    # f_score: costo total estimado (g_score + heurística) desde el inicio hasta la salida
-    # pasando por el nodo actual. Se inicializa con infinito.
-    f_score = { (f, c): float('inf') for f in range(filas) for c in range(columnas) }
-    f_score[inicio] = heuristica(inicio, salida)
+    def es_obstaculo(self, pos):
+        return self.celdas[self.indice(pos)] == 1
 
-    while open_set:
-        # Obtiene el nodo de open_set con el f_score más bajo
-        _, actual = heapq.heappop(open_set)
+def arreglo_en_ceros(n, tipo="i"):
+    """
+    Arreglo de n ceros respaldado por mmap anónimo. El sistema operativo solo
+    asigna las páginas que se escriben, así que la memoria usada es proporcional
+    a las celdas que la búsqueda toca y no al tamaño del laberinto.
+    """
+    mm = mmap.mmap(-1, n * struct.calcsize(tipo))
+    return memoryview(mm).cast(tipo)
+
+def a_estrella_rejilla(rejilla, inicio, salida, obs=None):
+    """
+    A* sobre una Rejilla. g se guarda en un arreglo plano (g+1; 0 = sin visitar)
+    y el predecesor como la dirección de llegada (1 byte por celda): cada nodo
+    es solo un índice, sin objetos.
+    La lista abierta son cubetas por valor de f (pilas de índices): meter y
+    sacar cuestan O(1) y dentro de una cubeta sale el último en entrar (LIFO),
+    que favorece al nodo más profundo. Un vecino solo entra si mejora su g;
+    las entradas viejas se descartan al sacarlas.
+    'obs' es un instrumentacion.Observador opcional (una capa por valor de f;
+    generados = entradas metidas a las cubetas, duplicados = entradas viejas).
+    """
+    ancho = rejilla.ancho
+    celdas = rejilla.celdas
+    s, t = rejilla.indice(inicio), rejilla.indice(salida)
+    g = arreglo_en_ceros(len(celdas), "i")
+    desde = arreglo_en_ceros(len(celdas), "B")
+    pasos = (1, -1, ancho, -ancho)   # derecha, izquierda, abajo, arriba
+    movs = tuple(enumerate(pasos, 1))
+    tf, tc = divmod(t, ancho)
+
+    sf, sc = divmod(s, ancho)
+    f = abs(sf - tf) + abs(sc - tc)
+    g[s] = 1
+    cubetas = [[] for _ in range(f + 1)]   # cubetas[f] = pila de índices
+    cubetas[f].append(s)
+    pendientes = 1
+    expandidos = viejos = 0
+    empujados = 1
+    if obs is not None:
+        obs.inicio("A* rejilla")
+        capa_f = f
 
-        # Si hemos llegado a la salida, reconstruimos y devolvemos el camino
-        if actual == salida:
+    while pendientes:
+        cubeta = cubetas[f]
+        while not cubeta:
+            f += 1
+            cubeta = cubetas[f]
+        i = cubeta.pop()
+        pendientes -= 1
+        if obs is not None and f != capa_f:
+            obs.capa(capa_f, expandidos, empujados, viejos, pendientes, expandidos)
+            capa_f = f
+        gi = g[i]
+        fi, ci = divmod(i, ancho)
+        if gi - 1 + abs(fi - tf) + abs(ci - tc) != f:
+            viejos += 1    # entrada vieja: ya se encontró un camino mejor
+            continue
+        expandidos += 1
+
+        if i == t:
             camino = []
-            while actual in vino_de:
-                camino.append(actual)
-                actual = vino_de[actual]
+            while i != s:
+                camino.append(rejilla.posicion(i))
+                i -= pasos[desde[i] - 1]
             camino.append(inicio)
-            return camino[::-1] # Devuelve el camino invertido (de inicio a fin)
-
-        # Explora los vecinos del nodo actual
-        for df, dc in vecinos:
-            vecino = (actual[0] + df, actual[1] + dc)
-
-            # Verifica si el vecino está dentro de los límites del laberinto
-            if 0 <= vecino[0] < filas and 0 <= vecino[1] < columnas:
-                # Si el vecino es un obstáculo, lo ignora
-                if laberinto[vecino[0]][vecino[1]] == '1':
-                    continue
-
-                # El costo para moverse a un vecino es 1
-                tentative_g_score = g_score[actual] + 1
-
-                # Si este camino hacia el vecino es mejor que el anterior registrado
-                if tentative_g_score < g_score[vecino]:
-                    vino_de[vecino] = actual
-                    g_score[vecino] = tentative_g_score
-                    f_score[vecino] = g_score[vecino] + heuristica(vecino, salida)
-                    # Si el vecino no está en open_set, lo añade
-                    if vecino not in [i[1] for i in open_set]:
-                        heapq.heappush(open_set, (f_score[vecino], vecino))
-
-    # Si el bucle termina y no se ha encontrado la salida, no hay camino posible
+            if obs is not None:
+                obs.fin(expandidos, empujados, viejos, pendientes, expandidos, True)
+            return camino[::-1]
+
+        ng = gi + 1
+        for k, d in movs:
+            j = i + d
+            if celdas[j]:
+                continue
+            gj = g[j]
+            if gj == 0 or ng < gj:
+                g[j] = ng
+                desde[j] = k
+                jf, jc = divmod(j, ancho)
+                fj = ng - 1 + abs(jf - tf) + abs(jc - tc)
+                while fj >= len(cubetas):  # con Manhattan, fj es f o f + 2
+                    cubetas.append([])
+                cubetas[fj].append(j)
+                pendientes += 1
+                empujados += 1
+
+    if obs is not None:
+        obs.fin(expandidos, empujados, viejos, 0, expandidos, False)
+    return None
+
+def a_estrella(laberinto, inicio, salida, obs=None):
+    """
+    Implementación del algoritmo de búsqueda A* para encontrar el camino más corto.
+    Adaptador sobre a_estrella_rejilla para el formato de listas de crear_laberinto.
+    'obs' es un instrumentacion.Observador opcional.
+    """
+    return a_estrella_rejilla(Rejilla.desde_lista(laberinto), inicio, salida, obs)
+
+def _saltar(celdas, i, d, t, perp):
+    """
+    Salto en línea recta en dirección d desde i. 'perp' es el paso
+    perpendicular (ancho si d es horizontal, 1 si es vertical).
+    - Horizontal: se detiene en la salida o en un vecino forzado.
+    - Vertical: además se detiene si un salto horizontal desde la celda
+      encuentra algo (así los caminos que doblan no se pierden).
+    Regresa el índice del punto de salto o -1 si choca con una pared.
+    """
+    vertical = perp == 1
+    while True:
+        if celdas[i]:
+            return -1
+        if i == t:
+            return i
+        # Vecino forzado: lado libre pero la celda de atrás en ese lado bloqueada
+        if (not celdas[i - perp] and celdas[i - d - perp]) or \
+           (not celdas[i + perp] and celdas[i - d + perp]):
+            return i
+        if vertical and (_saltar(celdas, i + 1, 1, t, abs(d)) != -1 or
+                         _saltar(celdas, i - 1, -1, t, abs(d)) != -1):
+            return i
+        i += d
+
+def jps_rejilla(rejilla, inicio, salida, obs=None):
+    """
+    Jump Point Search adaptado a 4 vecinos (mismos movimientos que a_estrella).
+    En vez de meter al heap cada celda, avanza en línea recta y solo mete los
+    puntos de salto; los sucesores de un punto se podan según la dirección de
+    llegada (de frente y a los lados, nunca hacia atrás).
+    Regresa el camino completo celda por celda, como a_estrella.
+    """
+    ancho = rejilla.ancho
+    celdas = rejilla.celdas
+    s, t = rejilla.indice(inicio), rejilla.indice(salida)
+    tf, tc = divmod(t, ancho)
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    sf, sc = divmod(s, ancho)
+    h = abs(sf - tf) + abs(sc - tc)
+    g = {s: 0}
+    padre = {s: None}
+    open_set = [(h, h, s)]
+    expandidos = viejos = 0
+    empujados = 1
+    if obs is not None:
+        obs.inicio("JPS")
+        capa_f = h
+
+    while open_set:
+        f, h, i = heappop(open_set)
+        if obs is not None and f != capa_f:
+            obs.capa(capa_f, expandidos, empujados, viejos, len(open_set), len(g))
+            capa_f = f
+        gi = f - h
+        if gi != g[i]:     # entrada vieja (borrado perezoso)
+            viejos += 1
+            continue
+        expandidos += 1
+
+        if i == t:
+            # Reconstruye rellenando las celdas entre puntos de salto
+            camino = [rejilla.posicion(i)]
+            while padre[i] is not None:
+                p = padre[i]
+                d = (1 if i > p else -1) if i // ancho == p // ancho else \
+                    (ancho if i > p else -ancho)
+                while i != p:
+                    i -= d
+                    camino.append(rejilla.posicion(i))
+            if obs is not None:
+                obs.fin(expandidos, empujados, viejos, len(open_set), len(g), True)
+            return camino[::-1]
+
+        # Direcciones a probar según cómo llegamos a i
+        p = padre[i]
+        if p is None:
+            dirs = (1, -1, ancho, -ancho)
+        elif i // ancho == p // ancho:
+            d = 1 if i > p else -1
+            dirs = (d, ancho, -ancho)
+        else:
+            d = ancho if i > p else -ancho
+            dirs = (d, 1, -1)
+
+        for d in dirs:
+            perp = 1 if d in (ancho, -ancho) else ancho
+            j = _saltar(celdas, i + d, d, t, perp)
+            if j == -1:
+                continue
+            ng = gi + abs(j - i) // abs(d)
+            if j not in g or ng < g[j]:
+                g[j] = ng
+                padre[j] = i
+                jf, jc = divmod(j, ancho)
+                hj = abs(jf - tf) + abs(jc - tc)
+                heappush(open_set, (ng + hj, hj, j))
+                empujados += 1
+
+    if obs is not None:
+        obs.fin(expandidos, empujados, viejos, 0, len(g), False)
     return None
 
+def jps(laberinto, inicio, salida, obs=None):
+    """Jump Point Search con la misma firma y resultado que a_estrella."""
+    return jps_rejilla(Rejilla.desde_lista(laberinto), inicio, salida, obs)
+
 def imprimir_laberinto(laberinto, inicio, salida, camino=None):
     """
     Imprime el laberinto en la consola, marcando el inicio, la salida y el camino.
@@ -133,6 +317,13 @@ def imprimir_laberinto(laberinto, inicio, salida, camino=None):
 
 # --- Bloque principal de ejecución ---
 if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Laberinto con búsqueda informada")
+    ap.add_argument("--algo", choices=["a_estrella", "jps"], default="a_estrella",
+                    help="A* celda por celda o Jump Point Search")
+    args = ap.parse_args()
+
     # Define las dimensiones del laberinto
     FILAS = 20
     COLUMNAS = 20
@@ -144,8 +335,9 @@ if __name__ == "__main__":
     print(f"Buscando ruta desde {inicio} hasta {salida}\n")
     imprimir_laberinto(laberinto, inicio, salida)
 
-    # Ejecuta el algoritmo A*
-    camino_encontrado = a_estrella(laberinto, inicio, salida)
+    # Ejecuta el algoritmo elegido (A* por defecto)
+    buscar = jps if args.algo == "jps" else a_estrella
+    camino_encontrado = buscar(laberinto, inicio, salida)
 
     print("\n\n--- Solución ---")
     if camino_encontrado:
@@ -0,0 +1,265 @@
+# ------------------------------------------------------------
+# Benchmark reproducible de todos los resolutores.
+#
+#   Conjuntos fijos de instancias:
+#     - puzzle: scramble_from_goal con semillas fijas a profundidad 10/20/30
+#               + instancias difíciles estándar (Korf 1985).
+#     - maze  : crear_laberinto con semillas fijas de 100x100 a 2000x2000.
+#
+#   Cada (instancia, resolutor) corre en un proceso NUEVO para que el pico de
+#   RSS sea el de esa corrida. Se mide: tiempo, nodos expandidos, nodos/s,
+#   pico de RSS y longitud de la solución. Cada corrida se repite --repeat
+#   veces y se guarda el mínimo (el ruido solo suma tiempo, nunca lo quita).
+#
+#   python benchmark.py run --suite puzzle --out base.json
+#   python benchmark.py run --suite puzzle --out nuevo.json
+#   python benchmark.py compare base.json nuevo.json   (sale con 1 si hay regresión)
+# ------------------------------------------------------------
+
+import argparse, json, multiprocessing as mp, platform, random, resource, signal, sys, time
+
+# ===== 1) Instancias =====
+PUZZLE_DEPTHS = [10, 20, 30]
+PUZZLE_SEEDS = range(5)
+
+# Primeras instancias de Korf (1985) en su notación (meta = hueco arriba a la
+# izquierda) con su longitud óptima. korf_to_goal las rota 180° y renombra las
+# piezas para nuestra meta (1..15, 0); la rotación conserva las longitudes.
+KORF = [
+    ("14 13 15 7 11 12 9 5 6 0 2 1 4 8 10 3", 57),
+    ("13 5 4 10 9 12 8 14 2 3 7 1 0 15 11 6", 55),
+    ("14 7 8 2 13 11 10 4 9 12 5 0 3 6 1 15", 59),
+    ("5 12 10 7 15 11 14 0 8 2 1 13 3 4 9 6", 56),
+    ("4 7 14 13 10 3 9 12 11 5 6 15 1 2 8 0", 56),
+    ("14 7 1 9 12 3 6 15 8 11 2 5 10 0 4 13", 52),
+    ("2 11 15 5 13 4 6 7 12 8 10 1 9 3 14 0", 52),
+    ("12 11 15 3 8 0 4 2 6 13 9 5 14 1 10 7", 50),
+    ("3 14 9 11 5 4 8 2 13 12 6 7 10 1 15 0", 46),
+    ("13 11 8 9 0 15 7 10 4 3 6 14 5 12 2 1", 59),
+]
+
+MAZE_SIZES = [100, 500, 1000, 2000]
+MAZE_SEEDS = range(3)
+
+def korf_to_goal(text):
+    """Convierte una instancia de Korf a nuestra meta (hueco abajo a la derecha)."""
+    a = [int(x) for x in text.split()]
+    b = [0] * 16
+    for i, t in enumerate(a):
+        b[15 - i] = 0 if t == 0 else 16 - t
+    return tuple(b)
+
+def puzzle_cases():
+    """Lista de (id, descripción) de las instancias del puzzle."""
+    cases = [(f"d{d}-s{s}", ("scramble", d, s)) for d in PUZZLE_DEPTHS for s in PUZZLE_SEEDS]
+    cases += [(f"korf{i+1}", ("korf", i)) for i in range(len(KORF))]
+    return cases
+
+def maze_cases():
+    """Lista de (id, descripción) de los laberintos."""
+    return [(f"{n}x{n}-s{s}", ("maze", n, s)) for n in MAZE_SIZES for s in MAZE_SEEDS]
+
+def make_puzzle(desc):
+    import puzzle
+    if desc[0] == "korf":
+        return korf_to_goal(KORF[desc[1]][0])
+    _, depth, seed = desc
+    return puzzle.scramble_from_goal(depth, seed)
+
+def make_maze(desc):
+    import Busqueda_informada
+    _, n, seed = desc
+    random.seed(seed)
+    return Busqueda_informada.crear_laberinto(n, n)
+
+# ===== 2) Resolutores =====
+PUZZLE_SOLVERS = ["bfs", "bibfs", "iddfs", "astar", "idastar"]
+MAZE_SOLVERS = ["a_estrella", "jps"]
+
+def run_puzzle(solver, state, pdb):
+    """Regresa (nodos_expandidos, longitud_de_solución o None)."""
+    import puzzle_batch
+    res = puzzle_batch.solve(state, solver, max_depth=80, pdb=pdb)
+    return res["expanded"], None if res["path"] is None else len(res["path"])
+
+def run_maze(solver, maze):
+    import Busqueda_informada
+    from instrumentacion import Observador
+    laberinto, inicio, salida = maze
+    obs = Observador()
+    camino = getattr(Busqueda_informada, solver)(laberinto, inicio, salida, obs=obs)
+    return obs.totales["expandidos"], None if camino is None else len(camino) - 1
+
+# ===== 3) Una corrida en un proceso aislado =====
+def _on_alarm(signum, frame):
+    raise TimeoutError
+
+def _child(suite, desc, solver, time_limit, pdb_path, conn):
+    """Genera la instancia (sin medir), corre el resolutor y manda las métricas."""
+    out = {}
+    try:
+        # Importaciones, PDB e instancia quedan fuera del tiempo medido
+        import puzzle_batch, Busqueda_informada
+        pdb = None
+        if pdb_path:
+            from puzzle_pdb import PatternDatabase
+            pdb = PatternDatabase(pdb_path)
+        instance = make_puzzle(desc) if suite == "puzzle" else make_maze(desc)
+        if time_limit:
+            signal.signal(signal.SIGALRM, _on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, time_limit)
+        t0 = time.perf_counter()
+        if suite == "puzzle":
+            expanded, length = run_puzzle(solver, instance, pdb)
+        else:
+            expanded, length = run_maze(solver, instance)
+        elapsed = time.perf_counter() - t0
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        out.update(status="ok", time=elapsed, expanded=expanded, length=length,
+                   nodes_per_sec=expanded / elapsed if expanded and elapsed > 0 else None)
+    except TimeoutError:
+        out.update(status="timeout")
+    except MemoryError:
+        out.update(status="memory")
+    # ru_maxrss está en KB en Linux
+    out["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    conn.send(out)
+
+def run_case(suite, desc, solver, time_limit=None, pdb_path=None):
+    """Lanza un proceso 'spawn' (sin heredar memoria del padre) para una corrida."""
+    ctx = mp.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    p = ctx.Process(target=_child, args=(suite, desc, solver, time_limit, pdb_path, child_conn))
+    p.start()
+    child_conn.close()
+    try:
+        out = parent_conn.recv()
+    except EOFError:          # el proceso murió (p. ej. OOM killer)
+        out = dict(status="crashed", peak_rss_kb=None)
+    p.join()
+    return out
+
+def run_repeated(suite, desc, solver, repeat=3, time_limit=None, pdb_path=None):
+    """
+    Repite run_case y se queda con el mínimo de tiempo y de RSS. Si una
+    repetición no termina bien, se reporta esa y no se sigue repitiendo.
+    """
+    runs = []
+    for _ in range(max(1, repeat)):
+        out = run_case(suite, desc, solver, time_limit, pdb_path)
+        if out["status"] != "ok":
+            return out
+        runs.append(out)
+    best = dict(min(runs, key=lambda o: o["time"]))
+    best["times"] = [o["time"] for o in runs]
+    rss = [o["peak_rss_kb"] for o in runs if o["peak_rss_kb"]]
+    best["peak_rss_kb"] = min(rss) if rss else None
+    return best
+
+def run(suite, solvers=None, time_limit=None, pdb_path=None, cases=None, verbose=True,
+        repeat=3):
+    """Corre todo el conjunto y regresa el reporte (dict serializable a JSON)."""
+    all_cases = puzzle_cases() if suite == "puzzle" else maze_cases()
+    if cases:
+        all_cases = [c for c in all_cases if any(c[0].startswith(x) for x in cases)]
+    solvers = solvers or (PUZZLE_SOLVERS if suite == "puzzle" else MAZE_SOLVERS)
+    results = []
+    for case_id, desc in all_cases:
+        for solver in solvers:
+            r = dict(case=case_id, solver=solver)
+            r.update(run_repeated(suite, desc, solver, repeat, time_limit, pdb_path))
+            if desc[0] == "korf":
+                r["optimal"] = KORF[desc[1]][1]
+            results.append(r)
+            if verbose:
+                t = f"{r['time']:.3f}s" if "time" in r else "-"
+                print(f"{case_id:>14} {solver:>10} {r['status']:>8} {t:>10} "
+                      f"nodos={r.get('expanded')} rss={r['peak_rss_kb']}KB", file=sys.stderr)
+    return dict(suite=suite, created=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                python=platform.python_version(), machine=platform.machine(),
+                time_limit=time_limit, pdb=pdb_path, repeat=repeat, results=results)
+
+# ===== 4) Comparación de reportes =====
+def compare(base, new, threshold=0.10, min_diff=0.005):
+    """
+    Compara dos reportes por (caso, resolutor). Es regresión si el tiempo o el
+    pico de RSS crecen más de 'threshold', si cambia la longitud de la solución,
+    si una corrida que terminaba ya no termina o si un caso de 'base' falta en
+    'new'. Diferencias de tiempo menores a 'min_diff' segundos no cuentan (en
+    casos de milisegundos el ruido supera a cualquier umbral relativo).
+    Regresa (líneas, #regresiones).
+    """
+    old = {(r["case"], r["solver"]): r for r in base["results"]}
+    lines, bad = [], 0
+    for r in new["results"]:
+        key = (r["case"], r["solver"])
+        o = old.get(key)
+        if o is None:
+            continue
+        notes = []
+        if o["status"] == "ok" and r["status"] != "ok":
+            notes.append(f"status {o['status']} -> {r['status']}")
+        if o["status"] == "ok" and r["status"] == "ok":
+            if r["time"] > o["time"] * (1 + threshold) and r["time"] - o["time"] > min_diff:
+                notes.append(f"tiempo {o['time']:.3f}s -> {r['time']:.3f}s")
+            if r["length"] != o["length"]:
+                notes.append(f"longitud {o['length']} -> {r['length']}")
+        if r["peak_rss_kb"] and o["peak_rss_kb"] and \
+                r["peak_rss_kb"] > o["peak_rss_kb"] * (1 + threshold):
+            notes.append(f"rss {o['peak_rss_kb']}KB -> {r['peak_rss_kb']}KB")
+        if notes:
+            bad += 1
+            lines.append(f"REGRESIÓN {key[0]} {key[1]}: " + "; ".join(notes))
+        elif o["status"] == "ok" and r["status"] == "ok" and o["time"] > 0:
+            lines.append(f"ok        {key[0]} {key[1]}: x{o['time'] / r['time']:.2f} velocidad")
+    seen = {(r["case"], r["solver"]) for r in new["results"]}
+    for key in old:
+        if key not in seen:
+            bad += 1
+            lines.append(f"REGRESIÓN {key[0]} {key[1]}: falta en el reporte nuevo")
+    return lines, bad
+
+# ===== 5) CLI =====
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark reproducible de los resolutores")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="Corre un conjunto y escribe el reporte JSON")
+    r.add_argument("--suite", choices=["puzzle", "maze"], default="puzzle")
+    r.add_argument("--solvers", nargs="+", default=None,
+                   help=f"Subconjunto de {PUZZLE_SOLVERS} o {MAZE_SOLVERS}")
+    r.add_argument("--cases", nargs="+", default=None,
+                   help="Prefijos de id de caso, p. ej. d10 korf 100x100")
+    r.add_argument("--time-limit", type=float, default=60,
+                   help="Segundos máximos por corrida")
+    r.add_argument("--pdb", type=str, default=None, help="PDB para astar/idastar")
+    r.add_argument("--repeat", type=int, default=3,
+                   help="Repeticiones por corrida (se guarda la más rápida)")
+    r.add_argument("--out", required=True, help="Archivo del reporte")
+
+    c = sub.add_parser("compare", help="Compara dos reportes")
+    c.add_argument("base")
+    c.add_argument("new")
+    c.add_argument("--threshold", type=float, default=0.10,
+                   help="Aumento relativo tolerado en tiempo y RSS")
+    c.add_argument("--min-diff", type=float, default=0.005,
+                   help="Segundos por debajo de los cuales no se cuenta una diferencia de tiempo")
+    args = ap.parse_args()
+
+    if args.cmd == "run":
+        report = run(args.suite, args.solvers, args.time_limit, args.pdb, args.cases,
+                     repeat=args.repeat)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=1)
+    else:
+        with open(args.base) as f:
+            base = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        lines, bad = compare(base, new, args.threshold, args.min_diff)
+        print("\n".join(lines))
+        print(f"\n{bad} regresión(es)")
+        sys.exit(1 if bad else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# ------------------------------------------------------------
+# Grafos grandes en formato CSR y BFS con arreglos.
+#
+#   - Los nodos se numeran 0..n-1; 'nombres' es la tabla externa id -> nombre
+#     e 'ids' la inversa. Las aristas quedan en dos arreglos planos:
+#       vecinos[inicio[u] : inicio[u+1]]  son los vecinos de u.
+#   - La BFS usa arreglos para padre/visitados (no listas ni sets) y regresa
+#     el camino más corto real y su longitud.
+#
+#   python grafo.py aristas.txt A N        (una arista "u v" por línea)
+# ------------------------------------------------------------
+
+import argparse, time
+from array import array
+
+class Grafo:
+    """Lista de adyacencia comprimida (CSR) con tabla de nombres."""
+    def __init__(self, nombres, inicio, vecinos):
+        self.nombres = nombres                       # id -> nombre
+        self.ids = {x: i for i, x in enumerate(nombres)}  # nombre -> id
+        self.inicio = inicio                         # array('q'), n+1 entradas
+        self.vecinos = vecinos                       # array('i'), m entradas
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def num_aristas(self):
+        return len(self.vecinos)
+
+    def vecinos_de(self, u):
+        """Vecinos (ids) del nodo con id u."""
+        return self.vecinos[self.inicio[u]:self.inicio[u + 1]]
+
+    @classmethod
+    def desde_aristas(cls, aristas, dirigido=True):
+        """
+        Construye el CSR desde un iterable de pares (nombre_u, nombre_v).
+        Se hace en dos pasadas (contar grados y luego colocar), sin listas
+        por nodo, así que sirve para millones de aristas.
+        """
+        ids, nombres = {}, []
+        origen, destino = array("i"), array("i")
+        for u, v in aristas:
+            for x in (u, v):
+                if x not in ids:
+                    ids[x] = len(nombres)
+                    nombres.append(x)
+            origen.append(ids[u])
+            destino.append(ids[v])
+            if not dirigido:
+                origen.append(ids[v])
+                destino.append(ids[u])
+        return cls._compactar(nombres, origen, destino)
+
+    @classmethod
+    def desde_dict(cls, graph):
+        """Convierte el formato dict-de-listas de laberitoBFS (conserva el orden)."""
+        g = cls.desde_aristas((u, v) for u, vs in graph.items() for v in vs)
+        # Los nodos sin aristas (p. ej. "F": []) también existen
+        for u in graph:
+            if u not in g.ids:
+                g.ids[u] = len(g.nombres)
+                g.nombres.append(u)
+                g.inicio.append(g.inicio[-1])
+        return g
+
+    @classmethod
+    def cargar_lista_aristas(cls, ruta, dirigido=True):
+        """Lee un archivo con una arista 'u v' por línea ('#' = comentario)."""
+        def aristas():
+            with open(ruta) as f:
+                for linea in f:
+                    partes = linea.split()
+                    if len(partes) >= 2 and not partes[0].startswith("#"):
+                        yield partes[0], partes[1]
+        return cls.desde_aristas(aristas(), dirigido)
+
+    @classmethod
+    def _compactar(cls, nombres, origen, destino):
+        """Ordenamiento por conteo de las aristas por origen (estable)."""
+        n = len(nombres)
+        inicio = array("q", bytes(8 * (n + 1)))
+        for u in origen:
+            inicio[u + 1] += 1
+        for u in range(n):
+            inicio[u + 1] += inicio[u]
+        pos = array("q", inicio[:n])
+        vecinos = array("i", bytes(4 * len(destino)))
+        for u, v in zip(origen, destino):
+            vecinos[pos[u]] = v
+            pos[u] += 1
+        return cls(nombres, inicio, vecinos)
+
+def bfs(grafo, origen, destino, obs=None):
+    """
+    BFS desde 'origen' hasta 'destino' (nombres). Regresa (longitud, camino)
+    con el camino más corto como lista de nombres, o (None, None) si no hay.
+    'padre' es un array de ints (-1 = no visitado) y la cola otro array que
+    solo crece: cada nodo entra a lo más una vez.
+    'obs' es un instrumentacion.Observador opcional (una capa por profundidad).
+    """
+    s, t = grafo.ids[origen], grafo.ids[destino]
+    inicio, vecinos = grafo.inicio, grafo.vecinos
+    padre = array("i", [-1]) * len(grafo)
+    padre[s] = s
+    cola = array("i", [s])
+    cabeza = 0
+    if obs is not None:
+        obs.inicio("BFS grafo")
+        profundidad, fin_capa = 0, 1
+        generados = contados = 0   # aristas revisadas de cola[:contados]
+    while cabeza < len(cola) and padre[t] == -1:
+        u = cola[cabeza]
+        cabeza += 1
+        for k in range(inicio[u], inicio[u + 1]):
+            v = vecinos[k]
+            if padre[v] == -1:
+                padre[v] = u
+                cola.append(v)
+        if obs is not None and cabeza == fin_capa:
+            # Cada arista revisada es una generación; las que no encolan, duplicados
+            generados += sum(inicio[x + 1] - inicio[x] for x in cola[contados:cabeza])
+            contados = cabeza
+            obs.capa(profundidad, cabeza, generados, generados - len(cola) + 1,
+                     len(cola) - cabeza, len(cola))
+            profundidad, fin_capa = profundidad + 1, len(cola)
+    if obs is not None:
+        generados += sum(inicio[x + 1] - inicio[x] for x in cola[contados:cabeza])
+        obs.fin(cabeza, generados, generados - len(cola) + 1, len(cola) - cabeza,
+                len(cola), padre[t] != -1)
+    if padre[t] == -1:
+        return None, None
+    camino = [t]
+    while camino[-1] != s:
+        camino.append(padre[camino[-1]])
+    camino.reverse()
+    return len(camino) - 1, [grafo.nombres[i] for i in camino]
+
+def main():
+    ap = argparse.ArgumentParser(description="BFS en un grafo grande (lista de aristas)")
+    ap.add_argument("aristas", help="Archivo con una arista 'u v' por línea")
+    ap.add_argument("origen")
+    ap.add_argument("destino")
+    ap.add_argument("--no-dirigido", action="store_true", help="Agrega cada arista en ambos sentidos")
+    args = ap.parse_args()
+
+    t0 = time.time()
+    g = Grafo.cargar_lista_aristas(args.aristas, dirigido=not args.no_dirigido)
+    t1 = time.time()
+    longitud, camino = bfs(g, args.origen, args.destino)
+    t2 = time.time()
+    print(f"{len(g)} nodos, {g.num_aristas()} aristas (carga {t1-t0:.2f}s, BFS {t2-t1:.3f}s)")
+    if camino is None:
+        print("No hay camino.")
+    else:
+        print("Longitud:", longitud)
+        print("Camino:", " -> ".join(camino))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+from collections import OrderedDict, deque
+
+from Busqueda_informada import Rejilla, arreglo_en_ceros
+
+class IndiceLaberinto:
+    """
+    Índice para muchas consultas (inicio, salida) sobre el MISMO laberinto.
+
+    - Al construirlo etiqueta las componentes conexas: si inicio y salida están
+      en componentes distintas, la consulta se rechaza en O(1) sin buscar.
+    - Por cada salida consultada calcula (una sola vez) el campo de distancias
+      con BFS desde la salida y lo guarda en una caché LRU de 'max_campos'
+      entradas. Con el campo, el camino es bajar por el gradiente: desde el
+      inicio siempre hay un vecino a distancia d-1.
+    """
+    def __init__(self, laberinto, max_campos=8):
+        self.rejilla = laberinto if isinstance(laberinto, Rejilla) else Rejilla.desde_lista(laberinto)
+        self.max_campos = max_campos
+        self.campos = OrderedDict()   # índice de salida -> distancias (+1; 0 = inalcanzable)
+        self.aciertos = 0
+        self.fallos = 0
+        self.componente, self.num_componentes = self._etiquetar()
+
+    def _etiquetar(self):
+        """Etiqueta cada celda libre con su componente (1, 2, ...); paredes = 0."""
+        ancho, celdas = self.rejilla.ancho, self.rejilla.celdas
+        pasos = (1, -1, ancho, -ancho)
+        comp = arreglo_en_ceros(len(celdas), "i")
+        etiqueta = 0
+        for i in range(len(celdas)):
+            if celdas[i] or comp[i]:
+                continue
+            etiqueta += 1
+            comp[i] = etiqueta
+            pila = [i]
+            while pila:
+                k = pila.pop()
+                for d in pasos:
+                    j = k + d
+                    if not celdas[j] and not comp[j]:
+                        comp[j] = etiqueta
+                        pila.append(j)
+        return comp, etiqueta
+
+    def alcanzable(self, inicio, salida):
+        """True si hay camino entre inicio y salida (O(1))."""
+        i, t = self.rejilla.indice(inicio), self.rejilla.indice(salida)
+        return self.componente[i] != 0 and self.componente[i] == self.componente[t]
+
+    def campo(self, salida):
+        """Campo de distancias hacia 'salida' (lo calcula o lo toma de la caché)."""
+        t = self.rejilla.indice(salida)
+        if t in self.campos:
+            self.campos.move_to_end(t)
+            self.aciertos += 1
+            return self.campos[t]
+        self.fallos += 1
+        ancho, celdas = self.rejilla.ancho, self.rejilla.celdas
+        pasos = (1, -1, ancho, -ancho)
+        dist = arreglo_en_ceros(len(celdas), "i")
+        dist[t] = 1
+        cola = deque([t])
+        while cola:
+            k = cola.popleft()
+            nd = dist[k] + 1
+            for d in pasos:
+                j = k + d
+                if not celdas[j] and not dist[j]:
+                    dist[j] = nd
+                    cola.append(j)
+        self.campos[t] = dist
+        if len(self.campos) > self.max_campos:
+            self.campos.popitem(last=False)   # descarta el menos usado
+        return dist
+
+    def distancia(self, inicio, salida):
+        """Longitud del camino más corto (en pasos) o None si no hay camino."""
+        if not self.alcanzable(inicio, salida):
+            return None
+        return self.campo(salida)[self.rejilla.indice(inicio)] - 1
+
+    def camino(self, inicio, salida):
+        """
+        Camino más corto como lista de (fila, columna), igual que a_estrella,
+        o None si la salida es inalcanzable.
+        """
+        if not self.alcanzable(inicio, salida):
+            return None
+        dist = self.campo(salida)
+        ancho = self.rejilla.ancho
+        pasos = (1, -1, ancho, -ancho)
+        i, t = self.rejilla.indice(inicio), self.rejilla.indice(salida)
+        camino = [inicio]
+        while i != t:
+            objetivo = dist[i] - 1
+            for d in pasos:
+                if dist[i + d] == objetivo:
+                    i += d
+                    break
+            camino.append(self.rejilla.posicion(i))
+        return camino
+
+    def invalidar(self):
+        """Tras modificar self.rejilla: vacía la caché y vuelve a etiquetar componentes."""
+        self.campos.clear()
+        self.componente, self.num_componentes = self._etiquetar()
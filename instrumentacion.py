@@ -0,0 +1,84 @@
+# ------------------------------------------------------------
+# Instrumentación común para todos los resolutores.
+#
+#   Cada resolutor acepta obs=None. Los contadores por nodo (expandidos,
+#   generados, duplicados) los lleva el propio resolutor en variables locales;
+#   al observador solo se le llama al cerrar cada capa (profundidad en BFS,
+#   límite en IDDFS/IDA*, valor de f en A*) y al final. Con obs=None no se
+#   hace ninguna llamada extra.
+#
+#   obs = Observador(progreso=5, memoria=True)
+#   solve_bfs(start, obs=obs)
+#   obs.guardar("stats.json")
+# ------------------------------------------------------------
+
+import json, sys, time, tracemalloc
+
+class Observador:
+    """
+    Junta contadores y tiempos por capa de una búsqueda.
+      - progreso: cada cuántos segundos imprimir una línea de avance (None = nunca)
+      - memoria : si True, mide el pico de memoria de Python con tracemalloc
+    Los máximos de frontera y cerrados se muestrean al cerrar cada capa.
+    """
+    def __init__(self, progreso=None, memoria=False, salida=sys.stderr):
+        self.progreso = progreso
+        self.memoria = memoria
+        self.salida = salida
+        self.algoritmo = None
+
+    def inicio(self, algoritmo):
+        """Lo llama el resolutor antes de empezar."""
+        self.algoritmo = algoritmo
+        self.capas = []
+        self.frontera_max = 0
+        self.cerrados_max = 0
+        self.totales = {}
+        self.pico_memoria = None
+        self._mem_propia = False
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._mem_propia = True
+        self.t0 = self._t_capa = self._t_impreso = time.perf_counter()
+
+    def capa(self, etiqueta, expandidos=0, generados=0, duplicados=0, frontera=0, cerrados=0):
+        """Cierra una capa; los contadores son ACUMULADOS desde el inicio."""
+        ahora = time.perf_counter()
+        self.frontera_max = max(self.frontera_max, frontera)
+        self.cerrados_max = max(self.cerrados_max, cerrados)
+        self.capas.append(dict(capa=etiqueta, tiempo=ahora - self._t_capa,
+                               expandidos=expandidos, generados=generados,
+                               duplicados=duplicados, frontera=frontera, cerrados=cerrados))
+        self._t_capa = ahora
+        if self.progreso is not None and ahora - self._t_impreso >= self.progreso:
+            self._t_impreso = ahora
+            t = ahora - self.t0
+            print(f"[{self.algoritmo}] {t:8.1f}s capa={etiqueta} expandidos={expandidos} "
+                  f"({expandidos / t if t > 0 else 0:.0f}/s) frontera={frontera} "
+                  f"cerrados={cerrados}", file=self.salida, flush=True)
+
+    def fin(self, expandidos=0, generados=0, duplicados=0, frontera=0, cerrados=0,
+            encontrado=None):
+        """Lo llama el resolutor al terminar (con o sin solución)."""
+        self.frontera_max = max(self.frontera_max, frontera)
+        self.cerrados_max = max(self.cerrados_max, cerrados)
+        self.totales = dict(expandidos=expandidos, generados=generados,
+                            duplicados=duplicados, encontrado=encontrado,
+                            tiempo=time.perf_counter() - self.t0)
+        if self.memoria:
+            self.pico_memoria = tracemalloc.get_traced_memory()[1]
+            if self._mem_propia:
+                tracemalloc.stop()
+
+    def resumen(self):
+        """Todo lo medido como dict serializable."""
+        return dict(algoritmo=self.algoritmo, **self.totales,
+                    frontera_max=self.frontera_max, cerrados_max=self.cerrados_max,
+                    pico_memoria=self.pico_memoria, capas=self.capas)
+
+    def a_json(self):
+        return json.dumps(self.resumen(), indent=1)
+
+    def guardar(self, ruta):
+        with open(ruta, "w") as f:
+            f.write(self.a_json())
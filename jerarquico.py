@@ -0,0 +1,551 @@
+# ------------------------------------------------------------
+# Búsqueda jerárquica para laberintos muy grandes (estilo HPA*).
+#
+#   - La rejilla se parte en grupos de tam x tam celdas. En la frontera
+#     entre dos grupos vecinos, los pares de celdas libres de ambos lados se
+#     clasifican por componente conexa (dentro de su grupo) de cada lado; de
+#     cada clase se deja un par de celdas como "entrada" cada 'espacio'
+#     celdas de frontera. Así un laberinto con muchos huecos chicos no llena
+#     la frontera de entradas que solo llevan a los mismos lugares.
+#   - Grafo abstracto: los nodos son las celdas de entrada (índice plano de
+#     Rejilla). Cada par se une con costo 1 y, dentro de cada grupo, se
+#     guarda la distancia entre cada dos de sus entradas sin salir del grupo.
+#   - Esas distancias salen de una BFS con bits: el grupo es un entero con un
+#     bit por celda libre y cada capa de la BFS son unos cuantos corrimientos
+#     y AND/OR sobre todo el grupo a la vez.
+#   - Perezoso: un grupo se construye la primera vez que una búsqueda lo toca
+#     (preparar() los construye todos). Al cambiar celdas solo se tiran y
+#     reconstruyen los grupos que las contienen y sus cuatro vecinos (las
+#     entradas de la frontera compartida pueden cambiar).
+#   - Consulta: A* sobre el grafo abstracto (inicio y salida se conectan a
+#     las entradas de su grupo) y luego cada tramo elegido se refina a celdas
+#     con la BFS de su grupo, uno a la vez. El camino es casi óptimo;
+#     suavizar() recorta rodeos con atajos rectos o en L, y peso > 1 cambia
+#     un poco de largo por muchas menos expansiones en mapas enormes.
+#
+#   jer = Jerarquia(rejilla, tam=64)
+#   camino = jer.buscar(inicio, salida, suavizado=True)
+#
+#   python jerarquico.py --archivo lab.bin --consultas 20 --comparar
+#   python jerarquico.py --archivo lab.bin --peso 1.2 --suavizar
+# ------------------------------------------------------------
+
+import argparse, heapq, random, time
+
+from Busqueda_informada import Rejilla, a_estrella_rejilla
+
+INF = float("inf")
+_A_BITS = bytes.maketrans(b"\x00\x01", b"10")   # celda libre -> '1', pared -> '0'
+
+# ===== 1) BFS con bits dentro de un grupo =====
+def _bits(x):
+    """Posiciones de los bits encendidos de x."""
+    while x:
+        b = x & -x
+        yield b.bit_length() - 1
+        x ^= b
+
+def _capas(libre, ancho, origen, destinos):
+    """
+    BFS desde el bit 'origen' sobre la máscara 'libre' (filas de 'ancho' bits;
+    el último bit de cada fila es una guarda en 0 para que los corrimientos
+    de ±1 no pasen de una fila a otra). Regresa la lista de capas: capas[d]
+    son las celdas a distancia d. Para en cuanto alcanzó todos los bits de
+    'destinos' o ya no crece.
+    """
+    frente = 1 << origen
+    capas = [frente]
+    resto = libre & ~frente          # celdas libres sin visitar
+    faltan = destinos & resto
+    while faltan:
+        frente = ((frente << 1) | (frente >> 1) | (frente << ancho) | (frente >> ancho)) & resto
+        if not frente:
+            break
+        resto ^= frente
+        capas.append(frente)
+        faltan &= resto
+    return capas
+
+def _componentes(libre, ancho, posiciones):
+    """
+    Etiqueta cada bit de 'posiciones' con su componente conexa en 'libre'
+    (la posición, en la lista, del primero de su componente).
+    """
+    etiquetas = [None] * len(posiciones)
+    for k, p in enumerate(posiciones):
+        if etiquetas[k] is not None:
+            continue
+        pendientes = [j for j in range(k + 1, len(posiciones)) if etiquetas[j] is None]
+        destinos = 0
+        for j in pendientes:
+            destinos |= 1 << posiciones[j]
+        alcanzados = 0
+        for capa in _capas(libre, ancho, p, destinos):
+            alcanzados |= capa & destinos
+        etiquetas[k] = k
+        for j in pendientes:
+            if alcanzados >> posiciones[j] & 1:
+                etiquetas[j] = k
+    return etiquetas
+
+class _Grupo:
+    """Grupo construido: máscara de celdas libres, entradas y sus aristas."""
+    __slots__ = ("f0", "c0", "ancho", "libre", "aristas", "bits", "destinos")
+
+    def __init__(self, f0, c0, ancho, libre):
+        self.f0, self.c0, self.ancho, self.libre = f0, c0, ancho, libre
+        self.aristas = {}     # celda de entrada -> [(celda, costo), ...]
+        self.bits = {}        # bit -> celda de entrada
+        self.destinos = 0     # máscara con los bits de todas las entradas
+
+# ===== 2) Grafo abstracto =====
+class Jerarquia:
+    """
+    Grafo abstracto por grupos de tam x tam sobre una Rejilla (sirve la de
+    cargar_rejilla). Para usar cambiar_celdas la rejilla debe ser escribible:
+    la de cargar_rejilla es de solo lectura.
+      - espacio: en una frontera, celdas entre entradas que llevan a las mismas
+        componentes (tam // 2 por defecto; menos = caminos más cortos, pero
+        más nodos)
+    """
+    def __init__(self, rejilla, tam=64, espacio=None):
+        if not isinstance(rejilla, Rejilla):
+            rejilla = Rejilla.desde_lista(rejilla)
+        self.rejilla = rejilla
+        self.tam = tam
+        self.espacio = espacio or tam // 2
+        self.grupos_f = -(-rejilla.filas // tam)
+        self.grupos_c = -(-rejilla.columnas // tam)
+        self.grupos = {}        # (gf, gc) -> _Grupo
+        self.mascaras = {}      # (gf, gc) -> (libre, ancho)
+        self.fronteras = {}     # ("v"|"h", gf, gc) -> [(celda de (gf, gc), celda del vecino)]
+        self.construidos = 0    # grupos construidos (incluye reconstrucciones)
+        self.ultima_actualizacion = None
+
+    # ----- grupos -----
+    def _grupo_de(self, i):
+        f, c = divmod(i, self.rejilla.ancho)
+        return (f - 1) // self.tam, (c - 1) // self.tam
+
+    def _limites(self, gf, gc):
+        """(fila, columna) de la esquina del grupo, alto y largo."""
+        f0, c0 = gf * self.tam, gc * self.tam
+        return (f0, c0, min(self.tam, self.rejilla.filas - f0),
+                min(self.tam, self.rejilla.columnas - c0))
+
+    def _bit(self, g, i):
+        """Índice plano -> bit dentro del grupo g."""
+        f, c = divmod(i, self.rejilla.ancho)
+        return (f - 1 - g.f0) * g.ancho + c - 1 - g.c0
+
+    def _frontera(self, clave):
+        """
+        Entradas entre el grupo (gf, gc) y el de su derecha (tipo "v") o el de
+        abajo (tipo "h"): lista de pares (celda de este lado, celda del otro).
+        """
+        pares = self.fronteras.get(clave)
+        if pares is not None:
+            return pares
+        tipo, gf, gc = clave
+        rej = self.rejilla
+        f0, c0, alto, largo = self._limites(gf, gc)
+        if tipo == "v":    # última columna del grupo contra la siguiente
+            a, paso, n, otro = rej.indice((f0, c0 + largo - 1)), rej.ancho, alto, 1
+        else:              # última fila del grupo contra la siguiente
+            a, paso, n, otro = rej.indice((f0 + alto - 1, c0)), 1, largo, rej.ancho
+        lado_a = rej.celdas[a:a + n * paso:paso]
+        lado_b = rej.celdas[a + otro:a + otro + n * paso:paso]
+        candidatos = [k for k in range(n) if not lado_a[k] and not lado_b[k]]
+        pares = []
+        if candidatos:
+            # Componente de cada candidato dentro de su grupo, de cada lado
+            libre_a, ancho_a = self._mascara(gf, gc)
+            libre_b, ancho_b = self._mascara(gf, gc + 1) if tipo == "v" else self._mascara(gf + 1, gc)
+            if tipo == "v":
+                bits_a = [k * ancho_a + largo - 1 for k in candidatos]
+                bits_b = [k * ancho_b for k in candidatos]
+            else:
+                bits_a = [(alto - 1) * ancho_a + k for k in candidatos]
+                bits_b = candidatos
+            clases = {}
+            for k, ca, cb in zip(candidatos, _componentes(libre_a, ancho_a, bits_a),
+                                 _componentes(libre_b, ancho_b, bits_b)):
+                clases.setdefault((ca, cb), []).append(k)
+            # De cada clase, una entrada (la de en medio) por cada 'espacio' celdas
+            for ks in clases.values():
+                ini = 0
+                while ini < len(ks):
+                    fin = ini
+                    while fin + 1 < len(ks) and ks[fin + 1] - ks[ini] < self.espacio:
+                        fin += 1
+                    t = ks[(ini + fin) // 2]
+                    pares.append((a + t * paso, a + t * paso + otro))
+                    ini = fin + 1
+        self.fronteras[clave] = pares
+        return pares
+
+    def _mascara(self, gf, gc):
+        """(libre, ancho): entero con un bit por celda libre del grupo y bits por fila."""
+        m = self.mascaras.get((gf, gc))
+        if m is None:
+            m = self.mascaras[gf, gc] = self._leer_mascara(gf, gc)
+        return m
+
+    def _leer_mascara(self, gf, gc):
+        rej = self.rejilla
+        f0, c0, alto, largo = self._limites(gf, gc)
+        filas = []
+        for r in range(alto):
+            i = rej.indice((f0 + r, c0))
+            filas.append(bytes(rej.celdas[i:i + largo]).translate(_A_BITS))
+        # El bit 0 es la primera celda: se invierte la cadena antes de int(..., 2)
+        return int(b"0".join(filas)[::-1], 2), largo + 1
+
+    def _grupo(self, clave):
+        g = self.grupos.get(clave)
+        if g is None:
+            g = self.grupos[clave] = self._construir(*clave)
+        return g
+
+    def _construir(self, gf, gc):
+        """Máscara del grupo, sus entradas y la distancia entre cada dos de ellas."""
+        f0, c0, _, _ = self._limites(gf, gc)
+        libre, ancho = self._mascara(gf, gc)
+        g = _Grupo(f0, c0, ancho, libre)
+
+        aristas = g.aristas
+        if gc + 1 < self.grupos_c:
+            for a, b in self._frontera(("v", gf, gc)):
+                aristas.setdefault(a, []).append((b, 1))
+        if gc > 0:
+            for a, b in self._frontera(("v", gf, gc - 1)):
+                aristas.setdefault(b, []).append((a, 1))
+        if gf + 1 < self.grupos_f:
+            for a, b in self._frontera(("h", gf, gc)):
+                aristas.setdefault(a, []).append((b, 1))
+        if gf > 0:
+            for a, b in self._frontera(("h", gf - 1, gc)):
+                aristas.setdefault(b, []).append((a, 1))
+
+        entradas = list(aristas)
+        g.bits = {self._bit(g, e): e for e in entradas}
+        for b in g.bits:
+            g.destinos |= 1 << b
+        # Distancias dentro del grupo: una BFS por entrada hacia las que siguen
+        resto = g.destinos
+        for e in entradas:
+            be = self._bit(g, e)
+            resto &= ~(1 << be)
+            if not resto:
+                break
+            for d, capa in enumerate(_capas(g.libre, g.ancho, be, resto)):
+                if capa & resto:
+                    for b in _bits(capa & resto):
+                        otra = g.bits[b]
+                        aristas[e].append((otra, d))
+                        aristas[otra].append((e, d))
+        self.construidos += 1
+        return g
+
+    def preparar(self):
+        """Construye todos los grupos de una vez (en lugar de al usarlos)."""
+        for gf in range(self.grupos_f):
+            for gc in range(self.grupos_c):
+                self._grupo((gf, gc))
+
+    def cambiar_celdas(self, cambios):
+        """
+        Aplica [((fila, columna), bloqueada), ...]. Los grupos afectados se
+        tiran y, si ya estaban construidos, se reconstruyen; los demás quedan
+        igual. Regresa cuántos grupos se reconstruyeron.
+        """
+        t0 = time.perf_counter()
+        rej, tam = self.rejilla, self.tam
+        tirar = set()
+        for pos, bloqueada in cambios:
+            rej.celdas[rej.indice(pos)] = 1 if bloqueada else 0
+            tirar.add((pos[0] // tam, pos[1] // tam))
+        for clave in tirar:
+            self.mascaras.pop(clave, None)
+        # Las entradas de una frontera dependen de las componentes de los dos
+        # grupos: se recalculan las cuatro fronteras y se tiran los vecinos
+        for gf, gc in list(tirar):
+            for clave, vecino in ((("v", gf, gc), (gf, gc + 1)), (("v", gf, gc - 1), (gf, gc - 1)),
+                                  (("h", gf, gc), (gf + 1, gc)), (("h", gf - 1, gc), (gf - 1, gc))):
+                if self.fronteras.pop(clave, None) is not None:
+                    tirar.add(vecino)
+        reconstruidos = 0
+        for clave in tirar:
+            if self.grupos.pop(clave, None) is not None:
+                self._grupo(clave)
+                reconstruidos += 1
+        self.ultima_actualizacion = dict(cambios=len(cambios), grupos=reconstruidos,
+                                         tiempo=time.perf_counter() - t0)
+        return reconstruidos
+
+    # ===== 3) Consultas =====
+    def _conectar(self, i, otra=None):
+        """
+        Aristas de la celda i a las entradas de su grupo: [(celda, costo)].
+        Si 'otra' está en el mismo grupo también se incluye (camino directo).
+        """
+        g = self._grupo(self._grupo_de(i))
+        bi = self._bit(g, i)
+        destinos = g.destinos & ~(1 << bi)
+        bo = None
+        if otra is not None and self._grupo_de(otra) == self._grupo_de(i):
+            bo = self._bit(g, otra)
+            destinos |= 1 << bo
+        aristas = []
+        for d, capa in enumerate(_capas(g.libre, g.ancho, bi, destinos)):
+            for b in _bits(capa & destinos) if capa & destinos else ():
+                aristas.append((otra if b == bo else g.bits[b], d))
+        return aristas
+
+    def camino_abstracto(self, inicio, salida, peso=1.0, obs=None):
+        """
+        A* sobre el grafo abstracto. Regresa la lista de celdas (fila, columna)
+        por las que pasa (inicio, entradas, salida) o None si no hay camino.
+        - peso: f = g + peso*h. Con peso > 1 se expanden muchos menos nodos a
+          cambio de caminos algo más largos (nunca más de peso veces el
+          mejor camino abstracto); cada nodo se expande una sola vez.
+        'obs' es un instrumentacion.Observador opcional (solo totales).
+        """
+        rej = self.rejilla
+        s, t = rej.indice(inicio), rej.indice(salida)
+        if rej.celdas[s] or rej.celdas[t]:
+            return None
+        if obs is not None:
+            obs.inicio("HPA*")
+        if s == t:
+            if obs is not None:
+                obs.fin(0, 0, 0, 0, 0, True)
+            return [inicio]
+        # Aristas temporales: inicio -> entradas de su grupo, entradas -> salida
+        extra = {s: self._conectar(s, t)}
+        for e, d in self._conectar(t):
+            extra.setdefault(e, []).append((t, d))
+
+        ancho = rej.ancho
+        tf, tc = divmod(t, ancho)
+        sf, sc = divmod(s, ancho)
+        g, padre = {s: 0}, {s: None}
+        cerrados = set()
+        abierta = [(peso * (abs(sf - tf) + abs(sc - tc)), 0, s)]   # (f, -g, celda)
+        expandidos = generados = 0
+        encontrado = False
+        while abierta:
+            _, menos_g, i = heapq.heappop(abierta)
+            gi = -menos_g
+            if i in cerrados:
+                continue      # entrada vieja
+            if i == t:
+                encontrado = True
+                break
+            cerrados.add(i)
+            expandidos += 1
+            grupo = self._grupo(self._grupo_de(i))
+            for vecinos in (grupo.aristas.get(i, ()), extra.get(i, ())):
+                for j, d in vecinos:
+                    ng = gi + d
+                    if ng < g.get(j, INF) and j not in cerrados:
+                        g[j] = ng
+                        padre[j] = i
+                        jf, jc = divmod(j, ancho)
+                        heapq.heappush(abierta, (ng + peso * (abs(jf - tf) + abs(jc - tc)), -ng, j))
+                        generados += 1
+        if obs is not None:
+            obs.fin(expandidos, generados, 0, len(abierta), len(cerrados), encontrado)
+        if not encontrado:
+            return None
+        camino, i = [], t
+        while i is not None:
+            camino.append(rej.posicion(i))
+            i = padre[i]
+        return camino[::-1]
+
+    def refinar(self, abstracto):
+        """
+        Convierte un camino abstracto en celdas, un tramo a la vez: genera, por
+        cada par de nodos seguidos, las celdas que los unen (sin repetir la
+        primera). Los pares de una entrada ya son vecinos; los demás están en
+        el mismo grupo y se unen con la BFS del grupo.
+        """
+        rej = self.rejilla
+        for a, b in zip(abstracto, abstracto[1:]):
+            i, j = rej.indice(a), rej.indice(b)
+            clave = self._grupo_de(i)
+            if clave != self._grupo_de(j):
+                yield [b]
+                continue
+            g = self._grupo(clave)
+            bj = self._bit(g, j)
+            capas = _capas(g.libre, g.ancho, self._bit(g, i), 1 << bj)
+            # De atrás hacia adelante: en la capa anterior siempre hay un vecino
+            ancho, f0, c0 = g.ancho, g.f0, g.c0
+            tramo, p = [b], bj
+            for capa in reversed(capas[1:-1]):
+                for q in (p - 1, p + 1, p - ancho, p + ancho):
+                    if q >= 0 and capa >> q & 1:
+                        p = q
+                        break
+                r, c = divmod(p, ancho)
+                tramo.append((f0 + r, c0 + c))
+            yield tramo[::-1]
+
+    def suavizar(self, camino, ventana=16):
+        """
+        Recorta rodeos: si desde camino[i] se llega a un camino[j] (a lo más
+        'ventana' pasos adelante) por una recta o una L libre más corta que el
+        tramo entre ellos, el tramo se cambia por ella. Si el tramo de
+        'ventana' pasos ya es tan corto como la distancia Manhattan, ningún
+        atajo dentro de él sirve y se salta media ventana.
+        """
+        rej, celdas = self.rejilla, self.rejilla.celdas
+
+        def libre(a, b):
+            """True si la recta de a a b (misma fila o columna) no tiene paredes."""
+            i, j = sorted((rej.indice(a), rej.indice(b)))
+            return not any(celdas[i:j + 1:1 if a[0] == b[0] else rej.ancho])
+
+        def recta(a, b):
+            """Celdas de la recta de a (sin incluirla) hasta b."""
+            df = (b[0] > a[0]) - (b[0] < a[0])
+            dc = (b[1] > a[1]) - (b[1] < a[1])
+            k = abs(b[0] - a[0]) + abs(b[1] - a[1])
+            return [(a[0] + df * s, a[1] + dc * s) for s in range(1, k + 1)]
+
+        nuevo = [camino[0]]
+        i, n = 0, len(camino)
+        while i < n - 1:
+            a = camino[i]
+            lejos = min(n - 1, i + ventana)
+            b = camino[lejos]
+            if abs(a[0] - b[0]) + abs(a[1] - b[1]) == lejos - i:
+                salto = max(1, (lejos - i) // 2)
+                nuevo.extend(camino[i + 1:i + salto + 1])
+                i += salto
+                continue
+            atajo = None
+            for j in range(lejos, i + 1, -1):
+                b = camino[j]
+                if abs(a[0] - b[0]) + abs(a[1] - b[1]) >= j - i:
+                    continue
+                if a[0] == b[0] or a[1] == b[1]:
+                    if libre(a, b):
+                        atajo = j, recta(a, b)
+                else:
+                    for esq in ((a[0], b[1]), (b[0], a[1])):
+                        if libre(a, esq) and libre(esq, b):
+                            atajo = j, recta(a, esq) + recta(esq, b)
+                            break
+                if atajo:
+                    break
+            if atajo:
+                i = atajo[0]
+                nuevo.extend(atajo[1])
+            else:
+                i += 1
+                nuevo.append(camino[i])
+        return nuevo
+
+    def buscar(self, inicio, salida, suavizado=False, peso=1.0, obs=None):
+        """Camino de inicio a salida como lista de (fila, columna), o None."""
+        abstracto = self.camino_abstracto(inicio, salida, peso, obs)
+        if abstracto is None:
+            return None
+        camino = [abstracto[0]]
+        for tramo in self.refinar(abstracto):
+            camino.extend(tramo)
+        return self.suavizar(camino) if suavizado else camino
+
+# ===== 4) CLI =====
+def _celda_libre(rejilla, rng):
+    while True:
+        pos = (rng.randrange(rejilla.filas), rng.randrange(rejilla.columnas))
+        if not rejilla.es_obstaculo(pos):
+            return pos
+
+def main():
+    ap = argparse.ArgumentParser(description="Búsqueda jerárquica (HPA*) en laberintos grandes")
+    ap.add_argument("--archivo", type=str, default=None,
+                    help="Laberinto LAB1 de laberinto_archivo.py (si no, se genera uno)")
+    ap.add_argument("--filas", type=int, default=1000)
+    ap.add_argument("--columnas", type=int, default=1000)
+    ap.add_argument("--densidad", type=float, default=0.25)
+    ap.add_argument("--semilla", type=int, default=None)
+    ap.add_argument("--tam", type=int, default=64, help="Lado de cada grupo en celdas")
+    ap.add_argument("--consultas", type=int, default=10)
+    ap.add_argument("--preparar", action="store_true",
+                    help="Construir todos los grupos antes de consultar")
+    ap.add_argument("--peso", type=float, default=1.0,
+                    help="Peso de la heurística en el A* abstracto (>1 = más rápido, más largo)")
+    ap.add_argument("--suavizar", action="store_true")
+    ap.add_argument("--comparar", action="store_true",
+                    help="Resolver también con a_estrella_rejilla y comparar largos")
+    ap.add_argument("--cambios", type=int, default=0,
+                    help="Celdas al azar que cambian después de las consultas (se repiten)")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    if args.archivo:
+        from laberinto_archivo import cargar_rejilla
+        rejilla = cargar_rejilla(args.archivo)
+        if args.cambios:     # la de cargar_rejilla es de solo lectura
+            rejilla = Rejilla(rejilla.filas, rejilla.columnas, bytearray(rejilla.celdas))
+    else:
+        from laberinto_archivo import generar_rejilla
+        rejilla, _, _ = generar_rejilla(args.filas, args.columnas, args.densidad, args.semilla)
+    print(f"Laberinto {rejilla.filas}x{rejilla.columnas} ({time.perf_counter() - t0:.1f}s)")
+
+    jer = Jerarquia(rejilla, args.tam)
+    if args.preparar:
+        t0 = time.perf_counter()
+        jer.preparar()
+        print(f"{len(jer.grupos)} grupos construidos ({time.perf_counter() - t0:.1f}s)")
+
+    rng = random.Random(args.semilla)
+    consultas = [(_celda_libre(rejilla, rng), _celda_libre(rejilla, rng))
+                 for _ in range(args.consultas)]
+
+    def correr():
+        for k, (inicio, salida) in enumerate(consultas, 1):
+            antes = jer.construidos
+            t1 = time.perf_counter()
+            abstracto = jer.camino_abstracto(inicio, salida, args.peso)
+            t2 = time.perf_counter()
+            camino = None
+            if abstracto is not None:
+                camino = [abstracto[0]]
+                for tramo in jer.refinar(abstracto):
+                    camino.extend(tramo)
+                if args.suavizar:
+                    camino = jer.suavizar(camino)
+            t3 = time.perf_counter()
+            largo = None if camino is None else len(camino) - 1
+            linea = (f"{k:3d}) {inicio}->{salida}: largo={largo}  "
+                     f"abstracto={(t2 - t1) * 1000:.1f}ms refinar={(t3 - t2) * 1000:.1f}ms  "
+                     f"grupos nuevos={jer.construidos - antes}")
+            if args.comparar:
+                t4 = time.perf_counter()
+                otro = a_estrella_rejilla(rejilla, inicio, salida)
+                optimo = None if otro is None else len(otro) - 1
+                linea += f"  |  A*: largo={optimo} {(time.perf_counter() - t4) * 1000:.1f}ms"
+                if largo and optimo:
+                    linea += f" (+{100 * (largo - optimo) / optimo:.1f}%)"
+            print(linea)
+
+    correr()
+    if args.cambios:
+        cambios = [((rng.randrange(rejilla.filas), rng.randrange(rejilla.columnas)),
+                    rng.random() < 0.5) for _ in range(args.cambios)]
+        puntas = {p for par in consultas for p in par}
+        cambios = [(p, b) for p, b in cambios if p not in puntas]
+        jer.cambiar_celdas(cambios)
+        act = jer.ultima_actualizacion
+        print(f"\n{act['cambios']} celdas cambiadas: {act['grupos']} grupos reconstruidos "
+              f"({act['tiempo'] * 1000:.1f}ms)")
+        correr()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# ------------------------------------------------------------
+# Generación rápida de laberintos y formato en disco mapeable.
+#
+#   generar_rejilla: como crear_laberinto pero reproducible (semilla propia) y
+#     sin un randint por celda: todo se hace con operaciones de bytes en C.
+#   Archivo: cabecera de 16 bytes + la Rejilla tal cual (1 byte por celda,
+#     con el borde de paredes), así cargar_rejilla la usa directamente desde
+#     mmap sin copiar ni convertir.
+#
+#     b"LAB1" | filas (uint32 LE) | columnas (uint32 LE) | 4 bytes reservados
+#
+#   python laberinto_archivo.py --filas 10000 --columnas 10000 --semilla 1 --out lab.bin
+# ------------------------------------------------------------
+
+import argparse, mmap, random, struct, time
+
+from Busqueda_informada import Rejilla
+
+MAGIC = b"LAB1"
+CABECERA = struct.Struct("<4sII4x")
+
+def _tabla(condicion):
+    """Tabla para bytes.translate: 1 si condicion(byte) es verdadera, 0 si no."""
+    return bytes(1 if condicion(x) else 0 for x in range(256))
+
+def generar_rejilla(filas, columnas, densidad_obstaculos=0.3, semilla=None):
+    """
+    Regresa (Rejilla, inicio, salida) con la misma semántica de densidad que
+    crear_laberinto: allá se eligen int(n*densidad) celdas CON reemplazo, así
+    que cada celda termina siendo pared con probabilidad 1-(1-1/n)**k. Aquí
+    cada celda es pared con esa misma probabilidad (con precisión de 1/65536),
+    comparando dos bytes aleatorios por celda contra un umbral de 16 bits.
+    """
+    n = filas * columnas
+    k = int(n * densidad_obstaculos)
+    p = 1 - (1 - 1 / n) ** k
+    q = min(round(p * 65536), 65535)
+    alto, bajo = q >> 8, q & 255
+
+    rng = random.Random(semilla)
+    b1, b2 = rng.randbytes(n), rng.randbytes(n)
+    # pared <=> b1 < alto  o  (b1 == alto  y  b2 < bajo); los ints hacen el
+    # AND/OR de todos los bytes de una vez
+    menor = int.from_bytes(b1.translate(_tabla(lambda x: x < alto)), "little")
+    igual = int.from_bytes(b1.translate(_tabla(lambda x: x == alto)), "little")
+    menor2 = int.from_bytes(b2.translate(_tabla(lambda x: x < bajo)), "little")
+    paredes = (menor | (igual & menor2)).to_bytes(n, "little")
+
+    # Agrega el borde de paredes que usa Rejilla
+    borde = b"\x01" * (columnas + 2)
+    partes = [borde]
+    for f in range(filas):
+        partes.append(b"\x01" + paredes[f * columnas:(f + 1) * columnas] + b"\x01")
+    partes.append(borde)
+    rejilla = Rejilla(filas, columnas, bytearray(b"".join(partes)))
+
+    # Igual que crear_laberinto: inicio y salida nunca son obstáculos
+    inicio = (0, 0)
+    salida = (filas - 1, columnas - 1)
+    rejilla.celdas[rejilla.indice(inicio)] = 0
+    rejilla.celdas[rejilla.indice(salida)] = 0
+    return rejilla, inicio, salida
+
+def guardar_rejilla(rejilla, ruta):
+    """Escribe la rejilla en el formato LAB1."""
+    with open(ruta, "wb") as f:
+        f.write(CABECERA.pack(MAGIC, rejilla.filas, rejilla.columnas))
+        f.write(rejilla.celdas)
+
+def cargar_rejilla(ruta):
+    """
+    Abre un archivo LAB1 con mmap de solo lectura y regresa una Rejilla cuyas
+    celdas apuntan directo al archivo: cargar es instantáneo y varios procesos
+    comparten las mismas páginas. Sirve con a_estrella_rejilla, jps_rejilla e
+    IndiceLaberinto (que solo leen las celdas).
+    """
+    with open(ruta, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, filas, columnas = CABECERA.unpack_from(mm)
+    if magic != MAGIC:
+        raise ValueError(f"{ruta} no es un laberinto LAB1.")
+    celdas = memoryview(mm)[CABECERA.size:]
+    if len(celdas) != (filas + 2) * (columnas + 2):
+        raise ValueError(f"{ruta} está truncado.")
+    return Rejilla(filas, columnas, celdas)
+
+def main():
+    ap = argparse.ArgumentParser(description="Genera un laberinto en formato LAB1")
+    ap.add_argument("--filas", type=int, required=True)
+    ap.add_argument("--columnas", type=int, required=True)
+    ap.add_argument("--densidad", type=float, default=0.3)
+    ap.add_argument("--semilla", type=int, default=None)
+    ap.add_argument("--out", required=True)
+    args = ap.parse_args()
+
+    t0 = time.time()
+    rejilla, _, _ = generar_rejilla(args.filas, args.columnas, args.densidad, args.semilla)
+    guardar_rejilla(rejilla, args.out)
+    print(f"{args.filas}x{args.columnas} escrito en {args.out} ({time.time()-t0:.1f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,12 @@
-from collections import deque
+from grafo import Grafo, bfs as bfs_csr
 
-def bfs(graph, nodo_inicial, nodo_buscado):
-    solution = []  ##Camino a tomar
-    costs = 0      ##Costo en tiempo 
-    nodos_frontera = deque()
-    nodos_visitados = []
-
-    nodos_frontera.append(nodo_inicial)
-    nodos_visitados.append(nodo_inicial)
-
-    while nodos_frontera:
-        ##print("Queue",nodos_frontera)
-        print("Nodos visitados",nodos_visitados)
-        nodo_actual = nodos_frontera.popleft()
-        solution.append(nodo_actual)
-        if nodo_actual == nodo_buscado:
-            break
-        ##if not graph[nodo_actual]:  
-           ## print(f"!!! {nodo_actual} es un callejón sin salida (pared)")
-        for vecino in graph[nodo_actual]:
-            if vecino not in nodos_visitados:
-                nodos_frontera.append(vecino)
-                nodos_visitados.append(vecino)
-
-        costs+=1
-    return costs, solution
+def bfs(graph, nodo_inicial, nodo_buscado, obs=None):
+    """
+    Convierte el dict de listas a un Grafo CSR y corre grafo.bfs.
+    Regresa (costo, camino): número de aristas y el camino más corto real
+    (no el orden de visita). (None, None) si no hay camino.
+    """
+    return bfs_csr(Grafo.desde_dict(graph), nodo_inicial, nodo_buscado, obs)
 
 graph = {
     "A": ["B"],
@@ -43,6 +25,7 @@ graph = {
     "J": [],
 }
 
-cost, path = bfs(graph, "A", "N")
-print("Costo:", cost)
-print("Camino recorrido:", path)
+if __name__ == "__main__":
+    cost, path = bfs(graph, "A", "N")
+    print("Costo:", cost)
+    print("Camino recorrido:", path)
@@ -1,229 +1,627 @@
-# ------------------------------------------------------------
-# 15-puzzle (4x4) con búsquedas a ciegas:
-#   - BFS  : garantiza mínima cantidad de movimientos (óptima)
-#   - IDDFS: DFS con profundización iterativa (poca memoria)
-#
-# Representación de estado:
-#   Tupla de 16 números (0..15). 0 es el hueco.
-#     Ejemplo objetivo: (1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,0)
-# ------------------------------------------------------------
-
-from collections import deque
-import random, time, sys, argparse
-
-# ===== 1) Parámetros base del problema =====
-N = 4  # tablero 4x4
-GOAL = tuple(list(range(1, N*N)) + [0])  # estado meta (1..15, 0)
-
-# ===== 2) Utilidades de índice y formato =====
-def idx_rc(i):
-    """Convierte un índice lineal [0..15] a (fila, columna)."""
-    return divmod(i, N)
-
-def swap(t, i, j):
-    """Regresa una tupla nueva intercambiando posiciones i <-> j."""
-    l = list(t)          # convertir a lista para poder mutar
-    l[i], l[j] = l[j], l[i]
-    return tuple(l)      # volver a tupla (inmutable = hashable)
-
-def pretty(state):
-    """Impresión amigable de un estado."""
-    w = len(str(N*N-1))  # ancho para alinear (2 dígitos)
-    filas = []
-    for i in range(0, N*N, N):
-        fila = ["." if x == 0 else f"{x:>{w}}" for x in state[i:i+N]]
-        filas.append(" ".join(fila))
-    return "\n".join(filas)
-
-# ===== 3) Generación de vecinos (movimientos) =====
-def neighbors(state):
-    """
-    Devuelve una lista de pares (acción, nuevo_estado).
-    Acciones: U/D/L/R moviendo el HUECO (0) si cabe.
-    """
-    z = state.index(0)       # posición del hueco
-    r, c = idx_rc(z)
-    res = []
-    if r > 0:   res.append(("U", swap(state, z, z-N)))  # subir
-    if r < N-1: res.append(("D", swap(state, z, z+N)))  # bajar
-    if c > 0:   res.append(("L", swap(state, z, z-1)))  # izquierda
-    if c < N-1: res.append(("R", swap(state, z, z+1)))  # derecha
-    return res
-
-# ===== 4) Comprobación de solvencia (paridad) =====
-def inversions(arr):
-    """Cuenta inversiones ignorando el 0 (criterio clásico del 15-puzzle)."""
-    a = [x for x in arr if x != 0]
-    inv = 0
-    for i in range(len(a)):
-        for j in range(i+1, len(a)):
-            if a[i] > a[j]:
-                inv += 1
-    return inv
-
-def is_solvable(state):
-    """
-    Para tableros 4x4: (inversiones + fila_del_cero_desde_abajo) debe ser impar.
-    Si no se cumple, ese estado NUNCA llega al objetivo.
-    """
-    inv = inversions(state)
-    z = state.index(0)
-    r, _ = idx_rc(z)
-    row_from_bottom = N - r  # 1 = última fila (abajo), 4 = fila de arriba
-    return (inv + row_from_bottom) % 2 == 1
-
-# ===== 5) Reconstrucción de la ruta (acciones) =====
-def rebuild(parent, goal):
-    """
-    parent: dict estado -> (padre, acción_para_llegar)
-    Recorre hacia atrás desde goal hasta el inicial y arma la lista de acciones.
-    """
-    path = []
-    s = goal
-    while True:
-        ps, a = parent[s]
-        if ps is None:       # llegamos al inicial
-            break
-        path.append(a)
-        s = ps
-    path.reverse()
-    return path
-
-# ===== 6) BFS: búsqueda en anchura (a ciegas) =====
-def solve_bfs(start):
-    """
-    Usa cola FIFO. Visita por niveles.
-    Como todos los pasos cuestan 1, la primera vez que vemos el objetivo
-    tenemos la solución con MENOR número de movimientos.
-    """
-    t0 = time.time()
-    q = deque([start])
-    parent = {start: (None, None)}  # quién me generó y con qué acción
-    expanded = 0
-
-    while q:
-        s = q.popleft()
-        if s == GOAL:
-            path = rebuild(parent, s)
-            return dict(algo="BFS", path=path, expanded=expanded, time=time.time()-t0)
-
-        # Generar vecinos y encolar los NUEVOS (evitamos repetidos)
-        for a, ns in neighbors(s):
-            if ns not in parent:
-                parent[ns] = (s, a)
-                q.append(ns)
-        expanded += 1
-
-    # Si se vacía la cola sin encontrar objetivo (poco usual con mezclas cortas)
-    return dict(algo="BFS", path=None, expanded=expanded, time=time.time()-t0)
-
-# ===== 7) IDDFS: DFS con profundización iterativa (a ciegas) =====
-def dls(state, depth, parent, en_rama):
-    """
-    DFS limitada a 'depth'.
-    - 'parent' guarda el árbol de generación.
-    - 'en_rama' evita ciclos en la rama actual (stack de DFS).
-    """
-    if state == GOAL:
-        return True
-    if depth == 0:
-        return False
-
-    en_rama.add(state)
-    for a, ns in neighbors(state):
-        if ns in en_rama:   # no regresar al mismo estado en la rama
-            continue
-        if ns not in parent:
-            parent[ns] = (state, a)
-        if dls(ns, depth-1, parent, en_rama):
-            return True
-    en_rama.remove(state)
-    return False
-
-def solve_iddfs(start, max_depth=40):
-    """
-    Ejecuta DFS repetidamente con límites 0,1,2,...,max_depth.
-    Ventaja: usa poca memoria como DFS, pero es completa si subimos el límite.
-    """
-    t0 = time.time()
-    total_expanded = 0  # aproximación: contamos cuántos estados llegaron a parent
-
-    for limit in range(max_depth + 1):
-        parent = {start: (None, None)}
-        found = dls(start, limit, parent, set())
-        total_expanded += len(parent)
-        if found:
-            path = rebuild(parent, GOAL)
-            return dict(algo=f"IDDFS(d={limit})", path=path,
-                        expanded=total_expanded, time=time.time()-t0)
-
-    return dict(algo="IDDFS", path=None, expanded=total_expanded, time=time.time()-t0)
-
-# ===== 8) Utilidades: mezclar estado y parsear entrada =====
-def scramble_from_goal(steps=12, seed=None):
-    """
-    Mezcla el tablero aplicando 'steps' movimientos válidos al objetivo.
-    Con esto GARANTIZAMOS que el resultado sí es resoluble.
-    """
-    if seed is not None:
-        random.seed(seed)
-    s = GOAL
-    prev = None
-    for _ in range(steps):
-        ops = neighbors(s)
-        if prev is not None:
-            # evita deshacer inmediatamente el movimiento anterior
-            ops = [x for x in ops if x[1] != prev]
-        a, ns = random.choice(ops)
-        prev, s = s, ns
-    return s
-
-def parse_state(s):
-    """
-    Convierte un string "1 2 3 ... 0" a tupla (valida rango y que no se repitan).
-    """
-    nums = [int(x) for x in s.replace(",", " ").split()]
-    if len(nums) != 16 or sorted(nums) != list(range(16)):
-        raise ValueError("Debes dar 16 números 0..15 sin repetir.")
-    return tuple(nums)
-
-# ===== 9) CLI mínimo para probar desde terminal =====
-def main():
-    ap = argparse.ArgumentParser(description="15-puzzle con búsquedas a ciegas (BFS / IDDFS)")
-    ap.add_argument("--algo", choices=["bfs", "iddfs"], default="bfs",
-                    help="Selecciona el algoritmo a ciegas")
-    ap.add_argument("--start", type=str,
-                    help='Estado inicial: 16 números, p. ej. "1 2 3 4 5 6 7 8 9 10 11 12 13 14 0 15"')
-    ap.add_argument("--scramble", type=int, default=12,
-                    help="Número de movimientos aleatorios desde el objetivo")
-    ap.add_argument("--seed", type=int, default=None, help="Semilla aleatoria (reproducible)")
-    ap.add_argument("--max-depth", type=int, default=40, help="Límite máximo para IDDFS")
-    args = ap.parse_args()
-
-    # Elegir estado inicial: dado por el usuario o mezclado desde el objetivo
-    start = parse_state(args.start) if args.start else scramble_from_goal(args.scramble, args.seed)
-
-    print("\nEstado inicial:")
-    print(pretty(start))
-
-    # Si metiste --start, verificamos solvencia (si no, avisamos y salimos)
-    if not is_solvable(start):
-        print("\n⚠️  Ese estado NO es resoluble para 4×4.", file=sys.stderr)
-        sys.exit(1)
-
-    # Resolver con el algoritmo pedido
-    if args.algo == "bfs":
-        res = solve_bfs(start)
-    else:
-        res = solve_iddfs(start, args.max_depth)
-
-    # Reporte compacto
-    print(f"\n[{res['algo']}]  tiempo={res['time']:.3f}s  nodos≈{res['expanded']}")
-    if res["path"] is None:
-        print("No se encontró solución con los límites dados.")
-        return
-    print(f"Longitud de solución: {len(res['path'])} movimientos")
-    print("Secuencia:", " ".join(res['path']))
-
-if __name__ == "__main__":
-    main()
+# ------------------------------------------------------------
+# n-puzzle (3x3, 4x4 o 5x5) con búsquedas a ciegas:
+#   - BFS  : garantiza mínima cantidad de movimientos (óptima)
+#   - IDDFS: DFS con profundización iterativa (poca memoria)
+#   - BiBFS: BFS desde el inicio y desde la meta a la vez (óptima)
+#   - BFS en disco (puzzle_bfs_disco.py): capas en archivos, RAM fija (solo 4x4)
+#
+# Representación de estado:
+#   Tupla de n*n números (0..n*n-1). 0 es el hueco. El tamaño del tablero
+#   se deduce del largo de la tupla (9, 16 o 25) o se da con n=3/4/5.
+#     Ejemplo objetivo 4x4: (1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,0)
+#   Alternativa empaquetada (packed=True / --packed):
+#     Un solo int: 4 bits por casilla (5 en 5x5) y la posición del hueco
+#     aparte en los bits altos (64..67 en 4x4). Ocupa mucho menos que la
+#     tupla y 'parent' solo necesita guardar la acción.
+# ------------------------------------------------------------
+
+from collections import deque
+import random, time, sys, argparse
+
+# ===== 1) Parámetros base del problema =====
+SIZES = (3, 4, 5)  # tableros soportados
+N = 4              # tamaño por defecto (15-puzzle)
+
+# Solución óptima más larga conocida por tamaño (en 5x5 es una cota superior)
+MAX_DEPTH = {3: 31, 4: 80, 5: 208}
+
+INVERSE = {"U": "D", "D": "U", "L": "R", "R": "L"}
+
+# ===== 2) Tablas precalculadas por tamaño =====
+class BoardTables:
+    """
+    Todo lo que depende del tamaño n, calculado una sola vez al importar:
+      goal      : estado meta (1..n*n-1, 0)
+      rc        : rc[i] = (fila, columna) de la casilla i
+      goal_rc   : goal_rc[pieza] = (fila, columna) de la pieza en la meta
+      manhattan : manhattan[pieza][casilla] = distancia a su meta (0 para el hueco)
+      moves     : moves[hueco] = [(acción, nueva_posición_del_hueco), ...]
+      pmoves    : pmoves[hueco] = [(acción, desplazamiento_de_la_pieza,
+                  desplazamiento_del_hueco, cambio_en_el_campo_del_hueco), ...]
+                  para estados empaquetados
+      neighbors / neighbors_packed: funciones de sucesores con estas tablas fijas
+    """
+    def __init__(self, n):
+        self.n = n
+        self.cells = cells = n * n
+        self.goal = tuple(range(1, cells)) + (0,)
+        self.rc = [divmod(i, n) for i in range(cells)]
+        self.goal_rc = [self.rc[cells - 1]] + [self.rc[p - 1] for p in range(1, cells)]
+        self.manhattan = [[0] * cells] + [
+            [abs(r - self.goal_rc[p][0]) + abs(c - self.goal_rc[p][1]) for r, c in self.rc]
+            for p in range(1, cells)]
+        self.max_depth = MAX_DEPTH[n]
+
+        self.moves = []
+        for z, (r, c) in enumerate(self.rc):
+            movs = []
+            if r > 0:     movs.append(("U", z - n))  # subir
+            if r < n - 1: movs.append(("D", z + n))  # bajar
+            if c > 0:     movs.append(("L", z - 1))  # izquierda
+            if c < n - 1: movs.append(("R", z + 1))  # derecha
+            self.moves.append(movs)
+
+        # Empaquetado: 'bits' por casilla y el hueco después de todas las casillas
+        self.bits = bits = (cells - 1).bit_length()
+        self.mask = (1 << bits) - 1
+        self.blank_shift = bits * cells
+        self.pmoves = [[(a, bits * nz, bits * z, (nz - z) << self.blank_shift)
+                        for a, nz in movs] for z, movs in enumerate(self.moves)]
+        self.goal_packed = sum(x << (bits * i) for i, x in enumerate(self.goal)) | \
+            (cells - 1) << self.blank_shift
+
+        moves, pmoves, mask, shift = self.moves, self.pmoves, self.mask, self.blank_shift
+
+        def neighbors(state):
+            z = state.index(0)       # posición del hueco
+            res = []
+            for a, nz in moves[z]:
+                l = list(state)
+                l[z], l[nz] = l[nz], 0
+                res.append((a, tuple(l)))
+            return res
+
+        def neighbors_packed(code):
+            res = []
+            for a, sp, sz, dz in pmoves[code >> shift]:
+                t = (code >> sp) & mask          # pieza que se desliza al hueco
+                res.append((a, code - (t << sp) + (t << sz) + dz))
+            return res
+
+        self.neighbors = neighbors
+        self.neighbors_packed = neighbors_packed
+
+TABLES = {n: BoardTables(n) for n in SIZES}
+_BY_CELLS = {t.cells: t for t in TABLES.values()}
+
+def board_tables(state=None, n=None):
+    """
+    Tablas del tablero: las del tamaño n si se da; si no, las que corresponden
+    al largo de la tupla. Un estado empaquetado no dice su tamaño: se usa N.
+    """
+    if n is None:
+        if state is None or isinstance(state, int):
+            n = N
+        else:
+            t = _BY_CELLS.get(len(state))
+            if t is None:
+                raise ValueError(f"Un tablero debe tener 9, 16 o 25 casillas (tiene {len(state)}).")
+            return t
+    t = TABLES.get(n)
+    if t is None:
+        raise ValueError(f"Tamaño de tablero no soportado: {n} (usa 3, 4 o 5).")
+    return t
+
+# Alias del 4x4: puzzle_bfs_disco (solo 4x4) usa BLANK_SHIFT y GOAL_PACKED;
+# GOAL se conserva por compatibilidad. Para otros tamaños, board_tables().
+GOAL = TABLES[N].goal            # estado meta (1..15, 0)
+BLANK_SHIFT = TABLES[N].blank_shift
+GOAL_PACKED = TABLES[N].goal_packed
+
+# ===== 3) Utilidades de índice y formato =====
+def idx_rc(i, n=N):
+    """Convierte un índice lineal [0..n*n-1] a (fila, columna)."""
+    return TABLES[n].rc[i]
+
+def swap(t, i, j):
+    """Regresa una tupla nueva intercambiando posiciones i <-> j."""
+    l = list(t)          # convertir a lista para poder mutar
+    l[i], l[j] = l[j], l[i]
+    return tuple(l)      # volver a tupla (inmutable = hashable)
+
+def pretty(state):
+    """Impresión amigable de un estado."""
+    n = board_tables(state).n
+    w = len(str(n*n-1))  # ancho para alinear
+    filas = []
+    for i in range(0, n*n, n):
+        fila = ["." if x == 0 else f"{x:>{w}}" for x in state[i:i+n]]
+        filas.append(" ".join(fila))
+    return "\n".join(filas)
+
+# ===== 4) Generación de vecinos (movimientos) =====
+def neighbors(state, packed=False, n=None):
+    """
+    Devuelve una lista de pares (acción, nuevo_estado).
+    Acciones: U/D/L/R moviendo el HUECO (0) si cabe, según la tabla 'moves'
+    del tamaño del tablero.
+    Con packed=True el estado es un int (ver neighbors_packed).
+    """
+    if packed:
+        return neighbors_packed(state, n)
+    return board_tables(state, n).neighbors(state)
+
+# ===== 4b) Estados empaquetados en un int =====
+def pack(state):
+    """Tupla -> int ('bits' por pieza + posición del hueco en los bits altos)."""
+    t = board_tables(state)
+    code = 0
+    for i, x in enumerate(state):
+        code |= x << (t.bits * i)
+    return code | state.index(0) << t.blank_shift
+
+def unpack(code, n=None):
+    """int empaquetado -> tupla de n*n."""
+    t = board_tables(n=n)
+    return tuple((code >> (t.bits * i)) & t.mask for i in range(t.cells))
+
+def neighbors_packed(code, n=None):
+    """Como neighbors() pero con estados empaquetados: solo operaciones de bits."""
+    return board_tables(n=n).neighbors_packed(code)
+
+def move_packed(code, action, n=None):
+    """Aplica una sola acción a un estado empaquetado."""
+    t = board_tables(n=n)
+    for a, sp, sz, dz in t.pmoves[code >> t.blank_shift]:
+        if a == action:
+            v = (code >> sp) & t.mask
+            return code - (v << sp) + (v << sz) + dz
+    raise ValueError(f"Movimiento {action} inválido")
+
+# ===== 5) Comprobación de solvencia (paridad) =====
+def inversions(arr):
+    """Cuenta inversiones ignorando el 0 (criterio clásico del 15-puzzle)."""
+    a = [x for x in arr if x != 0]
+    inv = 0
+    for i in range(len(a)):
+        for j in range(i+1, len(a)):
+            if a[i] > a[j]:
+                inv += 1
+    return inv
+
+def is_solvable(state):
+    """
+    Ancho impar (3x3, 5x5): las inversiones deben ser pares.
+    Ancho par (4x4): (inversiones + fila_del_cero_desde_abajo) debe ser impar.
+    Si no se cumple, ese estado NUNCA llega al objetivo.
+    """
+    n = board_tables(state).n
+    inv = inversions(state)
+    if n % 2 == 1:
+        return inv % 2 == 0
+    r = state.index(0) // n
+    row_from_bottom = n - r  # 1 = última fila (abajo), n = fila de arriba
+    return (inv + row_from_bottom) % 2 == 1
+
+# ===== 6) Reconstrucción de la ruta (acciones) =====
+def rebuild(parent, goal, packed=False, n=None):
+    """
+    parent: dict estado -> (padre, acción_para_llegar)
+    Recorre hacia atrás desde goal hasta el inicial y arma la lista de acciones.
+    Con packed=True, parent es dict int -> acción (None en el inicial) y el
+    padre se recupera aplicando la acción inversa.
+    """
+    path = []
+    s = goal
+    if packed:
+        while parent[s] is not None:
+            a = parent[s]
+            path.append(a)
+            s = move_packed(s, INVERSE[a], n)
+        path.reverse()
+        return path
+    while True:
+        ps, a = parent[s]
+        if ps is None:       # llegamos al inicial
+            break
+        path.append(a)
+        s = ps
+    path.reverse()
+    return path
+
+# ===== 7) BFS: búsqueda en anchura (a ciegas) =====
+def solve_bfs(start, packed=False, obs=None, n=None):
+    """
+    Usa cola FIFO. Visita por niveles.
+    Como todos los pasos cuestan 1, la primera vez que vemos el objetivo
+    tenemos la solución con MENOR número de movimientos.
+    Con packed=True los estados son ints y parent solo guarda la acción.
+    'obs' es un instrumentacion.Observador opcional (una capa por profundidad).
+    'n' es el tamaño del tablero (por defecto se deduce de 'start').
+    """
+    t0 = time.time()
+    t = board_tables(start, n)
+    if packed:
+        start, goal, succ = as_packed(start), t.goal_packed, t.neighbors_packed
+    else:
+        goal, succ = t.goal, t.neighbors
+    q = deque([start])
+    # quién me generó y con qué acción (empaquetado: solo la acción)
+    parent = {start: None if packed else (None, None)}
+    expanded = generated = 0
+    if obs is not None:
+        obs.inicio("BFS")
+        depth, layer_left = 0, 1   # estados que faltan por sacar de la capa actual
+
+    while q:
+        s = q.popleft()
+        if s == goal:
+            path = rebuild(parent, s, packed, t.n)
+            if obs is not None:
+                obs.fin(expanded, generated, generated - len(parent) + 1, len(q), len(parent), True)
+            return dict(algo="BFS", path=path, expanded=expanded, time=time.time()-t0)
+
+        # Generar vecinos y encolar los NUEVOS (evitamos repetidos)
+        ops = succ(s)
+        generated += len(ops)
+        for a, ns in ops:
+            if ns not in parent:
+                parent[ns] = a if packed else (s, a)
+                q.append(ns)
+        expanded += 1
+        if obs is not None:
+            layer_left -= 1
+            if layer_left == 0:
+                obs.capa(depth, expanded, generated, generated - len(parent) + 1, len(q), len(parent))
+                depth, layer_left = depth + 1, len(q)
+
+    # Si se vacía la cola sin encontrar objetivo (poco usual con mezclas cortas)
+    if obs is not None:
+        obs.fin(expanded, generated, generated - len(parent) + 1, 0, len(parent), False)
+    return dict(algo="BFS", path=None, expanded=expanded, time=time.time()-t0)
+
+# ===== 8) IDDFS: DFS con profundización iterativa (a ciegas) =====
+def dls(start, limit, n=N, prev=None, tt_size=2_000_000, counter=None):
+    """
+    DFS limitada a 'limit' movimientos, con pila explícita (sin recursión).
+    - 'start' es un estado empaquetado; regresa la lista de acciones hasta la
+      meta o None.
+    - No se genera el movimiento que deshace al anterior ('prev' es la acción
+      con la que se llegó a 'start', si la hay).
+    - Tabla de transposición acotada: estado -> profundidad restante con la
+      que ya se exploró SIN éxito; si se vuelve a llegar con la misma o menos,
+      ese subárbol se corta. Guarda a lo más 'tt_size' estados (lleno, solo
+      actualiza los que ya tiene). También corta los ciclos en la rama.
+    - 'counter' (opcional): lista [expandidos, generados, cortados_por_tabla].
+    """
+    t = TABLES[n]
+    goal, pmoves, mask, shift = t.goal_packed, t.pmoves, t.mask, t.blank_shift
+    if start == goal:
+        return []
+    if limit == 0:
+        return None
+    expanded = generated = cut = 0
+    tt = {start: limit}
+    codes = [start]                         # estados de la rama actual
+    acts = [prev]                           # acción con la que se llegó a cada uno
+    its = [iter(pmoves[start >> shift])]    # movimientos que faltan por probar
+    found = None
+    expanded += 1
+    while its:
+        mv = next(its[-1], None)
+        if mv is None:                      # se agotó el nodo: regresar
+            its.pop()
+            codes.pop()
+            acts.pop()
+            continue
+        a, sp, sz, dz = mv
+        if a == INVERSE.get(acts[-1]):
+            continue
+        code = codes[-1]
+        v = (code >> sp) & mask             # pieza que se desliza al hueco
+        ns = code - (v << sp) + (v << sz) + dz
+        generated += 1
+        if ns == goal:
+            found = acts[1:] + [a]
+            break
+        rem = limit - len(codes)
+        if rem == 0:
+            continue
+        seen = tt.get(ns)
+        if seen is not None and seen >= rem:
+            cut += 1
+            continue
+        if seen is not None or len(tt) < tt_size:
+            tt[ns] = rem
+        codes.append(ns)
+        acts.append(a)
+        its.append(iter(pmoves[ns >> shift]))
+        expanded += 1
+    if counter is not None:
+        counter[0] += expanded
+        counter[1] += generated
+        counter[2] += cut
+    return found
+
+def _dls_job(job):
+    """Un subárbol de la raíz en un proceso del pool (ver solve_iddfs)."""
+    i, code, limit, n, prev, tt_size = job
+    counter = [0, 0, 0]
+    return i, dls(code, limit, n, prev, tt_size, counter), counter
+
+def _root_split(start, depth, n):
+    """
+    Estados a profundidad exacta 'depth' desde la raíz (sin deshacer el
+    movimiento anterior), sin repetidos: lista de (estado, acciones).
+    """
+    layer = {start: []}
+    for _ in range(depth):
+        nxt = {}
+        for code, path in layer.items():
+            last = INVERSE.get(path[-1]) if path else None
+            for a, ns in neighbors_packed(code, n):
+                if a != last and ns not in nxt:
+                    nxt[ns] = path + [a]
+        layer = nxt
+    return list(layer.items())
+
+def solve_iddfs(start, max_depth=None, packed=False, obs=None, n=None,
+                workers=1, tt_size=2_000_000):
+    """
+    Ejecuta DFS repetidamente con límites 0,1,2,...,max_depth (por defecto la
+    solución óptima más larga del tamaño). La primera solución es óptima.
+    Ventaja: usa poca memoria como DFS, pero es completa si subimos el límite.
+    Internamente siempre usa estados empaquetados ('packed' se acepta por
+    compatibilidad) y una tabla de transposición nueva por iteración.
+    Con workers > 1 los subárboles de la raíz (a la profundidad donde hay
+    al menos 4 por proceso) se reparten en un pool de procesos, cada uno con
+    su propia tabla; al aparecer una solución se detiene el pool.
+    'expanded' cuenta expansiones reales, sumadas sobre todas las iteraciones.
+    """
+    t0 = time.time()
+    t = board_tables(start, n)
+    start = as_packed(start)
+    if max_depth is None:
+        max_depth = t.max_depth
+    counter = [0, 0, 0]  # expandidos, generados, cortados por la tabla
+    if obs is not None:
+        obs.inicio("IDDFS")
+
+    split, pool = [], None
+    if workers > 1:
+        import multiprocessing
+        depth = 0
+        while len(split) < 4 * workers and depth < max_depth:
+            depth += 1
+            split = _root_split(start, depth, t.n)
+        pool = multiprocessing.Pool(workers)
+
+    path = None
+    try:
+        for limit in range(max_depth + 1):
+            if pool is None or limit <= depth:
+                path = dls(start, limit, t.n, None, tt_size, counter)
+            else:
+                jobs = [(i, code, limit - depth, t.n, pre[-1], tt_size)
+                        for i, (code, pre) in enumerate(split)]
+                for i, sub, c in pool.imap_unordered(_dls_job, jobs):
+                    counter = [x + y for x, y in zip(counter, c)]
+                    if sub is not None:
+                        path = split[i][1] + sub
+                        break
+            if obs is not None:
+                obs.capa(limit, *counter, limit, 0)
+            if path is not None:
+                break
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+    if obs is not None:
+        obs.fin(*counter, 0, 0, path is not None)
+    if path is None:
+        return dict(algo="IDDFS", path=None, expanded=counter[0], time=time.time()-t0)
+    return dict(algo=f"IDDFS(d={limit})", path=path, expanded=counter[0], time=time.time()-t0)
+
+# ===== 8b) BFS bidireccional (a ciegas) =====
+def solve_bibfs(start, packed=False, obs=None, n=None):
+    """
+    BFS por capas desde 'start' y desde la meta; siempre se expande la frontera
+    más chica. Cuando una capa toca estados del otro lado se termina la capa
+    y se toma el cruce más corto: así la solución sigue siendo óptima.
+    Los movimientos son reversibles, así que la mitad de atrás se invierte.
+    """
+    t0 = time.time()
+    t = board_tables(start, n)
+    if packed:
+        start, goal, succ = as_packed(start), t.goal_packed, t.neighbors_packed
+    else:
+        goal, succ = t.goal, t.neighbors
+    root = None if packed else (None, None)
+    pf, pb = {start: root}, {goal: root}   # parent de cada lado
+    ff, fb = [start], [goal]               # frontera (capa actual) de cada lado
+    expanded = generated = 0
+    df = db = 0                            # profundidad de la capa de cada lado
+    if obs is not None:
+        obs.inicio("BiBFS")
+
+    if start == goal:
+        if obs is not None:
+            obs.fin(0, 0, 0, 1, 1, True)
+        return dict(algo="BiBFS", path=[], expanded=0, time=time.time()-t0)
+
+    while ff and fb:
+        forward = len(ff) <= len(fb)
+        frontier, mine, other = (ff, pf, pb) if forward else (fb, pb, pf)
+        nxt = []
+        best = None
+        for s in frontier:
+            ops = succ(s)
+            generated += len(ops)
+            for a, ns in ops:
+                if ns in mine:
+                    continue
+                mine[ns] = a if packed else (s, a)
+                nxt.append(ns)
+                if ns in other:   # se encontraron las fronteras
+                    back = rebuild(pb, ns, packed, t.n)
+                    path = rebuild(pf, ns, packed, t.n) + [INVERSE[x] for x in reversed(back)]
+                    if best is None or len(path) < len(best):
+                        best = path
+            expanded += 1
+        if obs is not None:
+            # ("adelante"|"atrás", profundidad de la capa expandida)
+            closed = len(pf) + len(pb)
+            dups = generated - closed + 2
+            obs.capa(("adelante", df) if forward else ("atrás", db),
+                     expanded, generated, dups, len(nxt) + len(fb if forward else ff), closed)
+        if best is not None:
+            if obs is not None:
+                obs.fin(expanded, generated, dups, 0, closed, True)
+            return dict(algo="BiBFS", path=best, expanded=expanded, time=time.time()-t0)
+        if forward:
+            ff, df = nxt, df + 1
+        else:
+            fb, db = nxt, db + 1
+
+    if obs is not None:
+        obs.fin(expanded, generated, generated - len(pf) - len(pb) + 2, 0, len(pf) + len(pb), False)
+    return dict(algo="BiBFS", path=None, expanded=expanded, time=time.time()-t0)
+
+# ===== 9) Utilidades: mezclar estado y parsear entrada =====
+def scramble_from_goal(steps=12, seed=None, packed=False, n=N):
+    """
+    Mezcla el tablero n x n aplicando 'steps' movimientos válidos al objetivo.
+    Con esto GARANTIZAMOS que el resultado sí es resoluble.
+    Con packed=True regresa el estado empaquetado (int).
+    """
+    if seed is not None:
+        random.seed(seed)
+    t = board_tables(n=n)
+    s = t.goal_packed if packed else t.goal
+    prev = None
+    for _ in range(steps):
+        ops = neighbors(s, packed, n)
+        if prev is not None:
+            # evita deshacer inmediatamente el movimiento anterior
+            ops = [x for x in ops if x[1] != prev]
+        a, ns = random.choice(ops)
+        prev, s = s, ns
+    return s
+
+def parse_state(s, n=None):
+    """
+    Convierte un string "1 2 3 ... 0" a tupla (valida rango y que no se repitan).
+    Sin 'n' el tamaño se deduce de cuántos números hay (9, 16 o 25).
+    """
+    nums = [int(x) for x in s.replace(",", " ").split()]
+    if n is None:
+        n = next((k for k in SIZES if k * k == len(nums)), None)
+        if n is None:
+            raise ValueError("Debes dar 9, 16 o 25 números (tablero 3x3, 4x4 o 5x5).")
+    cells = n * n
+    if len(nums) != cells or sorted(nums) != list(range(cells)):
+        raise ValueError(f"Debes dar {cells} números 0..{cells - 1} sin repetir.")
+    return tuple(nums)
+
+def as_packed(state):
+    """Acepta tupla o int y regresa el int empaquetado."""
+    return state if isinstance(state, int) else pack(state)
+
+# ===== 10) CLI mínimo para probar desde terminal =====
+def main():
+    ap = argparse.ArgumentParser(description="n-puzzle con búsquedas a ciegas (BFS / IDDFS / BiBFS)")
+    ap.add_argument("--algo", choices=["bfs", "iddfs", "bibfs", "bfsdisk"], default="bfs",
+                    help="Selecciona el algoritmo a ciegas")
+    ap.add_argument("--start", type=str,
+                    help='Estado inicial: n*n números, p. ej. "1 2 3 4 5 6 7 8 9 10 11 12 13 14 0 15"')
+    ap.add_argument("--size", type=int, choices=SIZES, default=None,
+                    help="Tamaño del tablero (por defecto 4, o el que indique --start)")
+    ap.add_argument("--scramble", type=int, default=12,
+                    help="Número de movimientos aleatorios desde el objetivo")
+    ap.add_argument("--seed", type=int, default=None, help="Semilla aleatoria (reproducible)")
+    ap.add_argument("--max-depth", type=int, default=None,
+                    help="Límite máximo para IDDFS (por defecto, la solución más larga del tamaño)")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="IDDFS: procesos entre los que se reparten los subárboles de la raíz")
+    ap.add_argument("--tt-size", type=int, default=2_000_000,
+                    help="IDDFS: estados máximos en la tabla de transposición")
+    ap.add_argument("--packed", action="store_true",
+                    help="Usa estados empaquetados en un int (menos memoria)")
+    ap.add_argument("--workdir", type=str, default="capas_bfs",
+                    help="Directorio para las capas de bfsdisk")
+    ap.add_argument("--ram-states", type=int, default=1_000_000,
+                    help="Estados en memoria antes de volcar una corrida (bfsdisk)")
+    ap.add_argument("--bfsdisk-max-depth", type=int, default=None,
+                    help="Última capa que genera bfsdisk (por defecto, hasta encontrar la meta)")
+    ap.add_argument("--all-layers", action="store_true",
+                    help="bfsdisk: no se detiene en la meta, cuenta capas completas "
+                         "hasta --bfsdisk-max-depth")
+    ap.add_argument("--cache", type=str, default=None,
+                    help="Archivo sqlite de puzzle_cache.py para reusar soluciones óptimas")
+    ap.add_argument("--stats", type=str, default=None,
+                    help="Guarda la instrumentación (por capa) en este JSON")
+    ap.add_argument("--progress", type=float, default=None,
+                    help="Imprime una línea de avance cada tantos segundos")
+    ap.add_argument("--tracemalloc", action="store_true",
+                    help="Mide el pico de memoria con tracemalloc (más lento)")
+    args = ap.parse_args()
+
+    obs = None
+    if args.stats or args.progress is not None or args.tracemalloc:
+        from instrumentacion import Observador
+        obs = Observador(progreso=args.progress, memoria=args.tracemalloc)
+
+    # Elegir estado inicial: dado por el usuario o mezclado desde el objetivo
+    if args.start:
+        start = parse_state(args.start, args.size)
+    else:
+        start = scramble_from_goal(args.scramble, args.seed, n=args.size or N)
+    n = board_tables(start).n
+    if args.algo == "bfsdisk" and n != 4:
+        ap.error("bfsdisk solo está implementado para 4x4")
+    if args.all_layers and args.bfsdisk_max_depth is None:
+        ap.error("--all-layers necesita --bfsdisk-max-depth (el 4x4 completo no cabe en disco)")
+
+    print("\nEstado inicial:")
+    print(pretty(start))
+
+    # Si metiste --start, verificamos solvencia (si no, avisamos y salimos)
+    if not is_solvable(start):
+        print(f"\n⚠️  Ese estado NO es resoluble para {n}×{n}.", file=sys.stderr)
+        sys.exit(1)
+
+    # Resolver con el algoritmo pedido
+    def run(s):
+        if args.algo == "bfs":
+            return solve_bfs(s, args.packed, obs)
+        if args.algo == "bibfs":
+            return solve_bibfs(s, args.packed, obs)
+        if args.algo == "bfsdisk":
+            from puzzle_bfs_disco import solve_bfs_disk
+            res = solve_bfs_disk(s, args.workdir, args.ram_states, args.bfsdisk_max_depth,
+                                 stop_at_goal=not args.all_layers, obs=obs)
+            print("\nEstados por profundidad:", res["layers"])
+            return res
+        return solve_iddfs(s, args.max_depth, args.packed, obs,
+                           workers=args.workers, tt_size=args.tt_size)
+
+    if args.cache:
+        from puzzle_cache import SolutionCache
+        with SolutionCache(args.cache) as cache:
+            res = cache.solve(start, run)
+    else:
+        res = run(start)
+    if args.stats and obs.algoritmo is not None:   # con acierto de caché no hubo búsqueda
+        obs.guardar(args.stats)
+
+    # Reporte compacto
+    print(f"\n[{res['algo']}]  tiempo={res['time']:.3f}s  nodos≈{res['expanded']}")
+    if res["path"] is None:
+        print("No se encontró solución con los límites dados.")
+        return
+    print(f"Longitud de solución: {len(res['path'])} movimientos")
+    print("Secuencia:", " ".join(res['path']))
+
+if __name__ == "__main__":
+    main()
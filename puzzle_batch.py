@@ -0,0 +1,250 @@
+# ------------------------------------------------------------
+# Resolutor por lotes del 15-puzzle.
+#
+#   - Lee muchas instancias (una por línea, formato de puzzle.parse_state)
+#     desde un archivo o desde stdin. El tamaño (3x3, 4x4, 5x5) se deduce de
+#     cuántos números tiene cada línea, así que se pueden mezclar.
+#   - Las reparte en un pool de procesos (--workers) con presupuesto de
+#     tiempo (--time-limit) y de memoria (--mem-limit) por instancia.
+#   - Escribe un JSON por línea en orden de TERMINACIÓN (streaming).
+#   - Si un trabajador muere (OOM, señal) se rehace el pool y lo pendiente
+#     se reintenta de una en una; solo la instancia que rompe el pool estando
+#     sola sale como "crashed".
+#
+# Ejemplo:
+#   python puzzle_batch.py instancias.txt --algo idastar --workers 8 \
+#          --time-limit 30 --mem-limit 2048 > resultados.jsonl
+# ------------------------------------------------------------
+
+import argparse, json, os, resource, signal, sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+import puzzle
+import puzzle_busqueda_informada as informada
+
+ALGOS = ["bfs", "iddfs", "bibfs", "astar", "idastar", "arastar"]
+OPTIMAL = {"bfs", "iddfs", "bibfs", "astar", "idastar"}   # los que se pueden guardar en la caché
+
+# ===== 1) Estado de cada proceso trabajador =====
+_pdb = None        # PatternDatabase compartida por mmap (opcional)
+_time_limit = None # segundos por instancia
+_cache = None      # puzzle_cache.SolutionCache (opcional), una conexión por proceso
+
+def _init_worker(mem_limit_mb, time_limit, pdb_path, cache_path=None):
+    """Se ejecuta una vez por proceso: límite de memoria, de tiempo, PDB y caché."""
+    global _pdb, _time_limit, _cache
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C lo maneja el padre
+    if mem_limit_mb:
+        limit = mem_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    _time_limit = time_limit
+    if pdb_path:
+        from puzzle_pdb import PatternDatabase
+        _pdb = PatternDatabase(pdb_path)
+    if cache_path:
+        from puzzle_cache import SolutionCache
+        _cache = SolutionCache(cache_path)
+
+def _on_alarm(signum, frame):
+    raise TimeoutError
+
+def solve(state, algo, max_depth=None, packed=False, pdb=None, obs=None, time_limit=None):
+    """
+    Despacha a cualquiera de los algoritmos; todos regresan el mismo dict.
+    'time_limit' solo lo usa arastar, que al agotarlo regresa su mejor solución.
+    """
+    if algo == "bfs":
+        return puzzle.solve_bfs(state, packed, obs)
+    if algo == "iddfs":
+        return puzzle.solve_iddfs(state, max_depth, packed, obs)
+    if algo == "bibfs":
+        return puzzle.solve_bibfs(state, packed, obs)
+    if algo == "astar":
+        return informada.a_star_search(state, pdb=pdb, verbose=False, obs=obs)
+    if algo == "idastar":
+        return informada.ida_star_search(state, pdb=pdb, obs=obs)
+    if algo == "arastar":
+        return informada.ara_star_search(state, time_limit=time_limit, pdb=pdb, obs=obs)
+    raise ValueError(f"Algoritmo desconocido: {algo}")
+
+def solve_one(job):
+    """
+    Resuelve una instancia dentro del trabajador y regresa un dict listo para
+    JSON. Los presupuestos agotados se reportan en 'status', no como excepción.
+    """
+    line_no, state, algo, max_depth, packed = job
+    out = dict(id=line_no, start=list(state), algo=algo)
+    if not puzzle.is_solvable(state):
+        out["status"] = "unsolvable"
+        return out
+    if _time_limit:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, _time_limit)
+    try:
+        # ARA* corta un poco antes de la alarma para entregar lo que lleve
+        run = lambda s: solve(s, algo, max_depth, packed, _pdb,
+                              time_limit=_time_limit * 0.9 if _time_limit else None)
+        res = _cache.solve(state, run, algo in OPTIMAL) if _cache is not None else run(state)
+    except TimeoutError:
+        out["status"] = "timeout"
+        return out
+    except MemoryError:
+        out["status"] = "memory"
+        return out
+    except ValueError as e:      # p. ej. --pdb con un tablero que no es 4x4
+        out.update(status="error", error=str(e))
+        return out
+    finally:
+        if _time_limit:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    out.update(status="ok" if res["path"] is not None else "not_found",
+               label=res["algo"], expanded=res["expanded"], time=res["time"])
+    if res["path"] is not None:
+        out.update(length=len(res["path"]), path="".join(res["path"]))
+        if "bound" in res:
+            out["bound"] = res["bound"]
+    return out
+
+# ===== 2) Lectura de instancias =====
+def read_instances(f):
+    """Genera (número_de_línea, estado o mensaje_de_error); ignora vacías y '#'."""
+    for line_no, line in enumerate(f, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield line_no, puzzle.parse_state(line)
+        except ValueError as e:
+            yield line_no, str(e)
+
+# ===== 3) Bucle principal =====
+def _crashed(job, error):
+    """Registro de una instancia cuyo trabajador murió (OOM, señal, ...)."""
+    line_no, state, algo = job[:3]
+    return dict(id=line_no, start=list(state), algo=algo, status="crashed", error=error)
+
+def run_batch(instances, algo, workers, out, time_limit=None, mem_limit_mb=None,
+              pdb_path=None, max_depth=None, packed=False, cache_path=None):
+    """
+    Envía instancias al pool manteniendo a lo más 'workers*4' pendientes (así
+    stdin se consume en streaming) y escribe cada resultado al terminar.
+    Si un trabajador muere el pool entero se rompe y no se sabe qué instancia
+    fue: el pool se rehace y las que estaban pendientes pasan a "sospechosas",
+    que se corren de una en una en un pool aparte de un solo proceso. Solo la
+    que rompe ese pool estando sola se reporta con status "crashed" (igual
+    que cualquier otra excepción al recoger su resultado).
+    Regresa cuántas instancias se procesaron.
+    """
+    done_count = 0
+    pending = {}       # futuro -> (job, corre_sola)
+    suspects = deque()
+    new_pool = lambda k: ProcessPoolExecutor(
+        max_workers=k, initializer=_init_worker,
+        initargs=(mem_limit_mb, time_limit, pdb_path, cache_path))
+    pool = new_pool(workers)
+    solo = None        # pool de un proceso para las sospechosas (se crea al necesitarlo)
+    solo_busy = False
+
+    def write(res):
+        nonlocal done_count
+        out.write(json.dumps(res) + "\n")
+        done_count += 1
+
+    def next_suspect():
+        nonlocal solo, solo_busy
+        if solo_busy or not suspects:
+            return
+        if solo is None:
+            solo = new_pool(1)
+        job = suspects.popleft()
+        pending[solo.submit(solve_one, job)] = (job, True)
+        solo_busy = True
+
+    def flush(which):
+        nonlocal pool, solo, solo_busy
+        pool_broken = False
+        for fut in which:
+            job, alone = pending.pop(fut)
+            if alone:
+                solo_busy = False
+            try:
+                write(fut.result())
+            except BrokenProcessPool:
+                if alone:        # estaba sola: ella rompió el pool
+                    write(_crashed(job, "El proceso trabajador terminó de forma abrupta"))
+                    solo.shutdown(wait=True)
+                    solo = None
+                else:
+                    pool_broken = True
+                    suspects.append(job)
+            except Exception as e:
+                write(_crashed(job, f"{type(e).__name__}: {e}"))
+        if pool_broken:
+            # Con el pool roto todo lo que tenía pendiente falla también
+            rest = [f for f, (_, alone) in pending.items() if not alone]
+            wait(rest)
+            for fut in rest:
+                job, _ = pending.pop(fut)
+                try:
+                    write(fut.result())
+                except Exception:
+                    suspects.append(job)
+            pool.shutdown(wait=True)
+            pool = new_pool(workers)
+        next_suspect()
+        out.flush()
+
+    try:
+        for line_no, state in instances:
+            if isinstance(state, str):   # línea inválida: se reporta tal cual
+                out.write(json.dumps(dict(id=line_no, status="error", error=state)) + "\n")
+                continue
+            job = (line_no, state, algo, max_depth, packed)
+            pending[pool.submit(solve_one, job)] = (job, False)
+            if len(pending) + len(suspects) >= workers * 4:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                flush(done)
+        while pending or suspects:
+            next_suspect()
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            flush(done)
+    finally:
+        pool.shutdown(wait=True)
+        if solo is not None:
+            solo.shutdown(wait=True)
+    return done_count
+
+def main():
+    ap = argparse.ArgumentParser(description="15-puzzle por lotes con salida JSONL")
+    ap.add_argument("input", nargs="?", default="-",
+                    help="Archivo con una instancia por línea ('-' = stdin)")
+    ap.add_argument("--algo", choices=ALGOS, default="idastar")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="Procesos en paralelo (por defecto, todos los núcleos)")
+    ap.add_argument("--time-limit", type=float, default=None,
+                    help="Segundos máximos por instancia")
+    ap.add_argument("--mem-limit", type=int, default=None,
+                    help="MB máximos por proceso trabajador")
+    ap.add_argument("--pdb", type=str, default=None,
+                    help="PDB de puzzle_pdb.py para astar/idastar")
+    ap.add_argument("--cache", type=str, default=None,
+                    help="Archivo sqlite de puzzle_cache.py compartido por los trabajadores")
+    ap.add_argument("--max-depth", type=int, default=None,
+                    help="Límite máximo para IDDFS (por defecto, la solución más larga del tamaño)")
+    ap.add_argument("--packed", action="store_true",
+                    help="Estados empaquetados para bfs/iddfs/bibfs")
+    args = ap.parse_args()
+
+    f = sys.stdin if args.input == "-" else open(args.input)
+    try:
+        run_batch(read_instances(f), args.algo, args.workers, sys.stdout,
+                  args.time_limit, args.mem_limit, args.pdb, args.max_depth, args.packed,
+                  args.cache)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# ------------------------------------------------------------
+# BFS en memoria externa para el 15-puzzle (capas en disco).
+#
+#   - Cada capa (profundidad d) es un archivo binario ORDENADO de estados
+#     empaquetados de 64 bits (4 bits por casilla, ver puzzle.pack).
+#   - Detección de duplicados diferida: los sucesores de la capa d se juntan
+#     en un buffer de tamaño fijo; cada vez que se llena se ordena y se escribe
+#     como "corrida". Al final se mezclan todas las corridas y se quitan los
+#     estados de las capas d y d-1 (los únicos donde puede haber repetidos).
+#   - No hay 'parent': la ruta se recupera hacia atrás buscando, para cada
+#     estado, un vecino en la capa anterior (búsqueda binaria en el archivo).
+#
+# La RAM usada es ~ram_states enteros, sin importar la profundidad.
+#
+#   python puzzle.py --algo bfsdisk --workdir /tmp/capas --ram-states 2000000
+#   python puzzle.py --algo bfsdisk --all-layers --bfsdisk-max-depth 20   (capas completas)
+# ------------------------------------------------------------
+
+import heapq, mmap, os, time
+from array import array
+
+import puzzle
+
+MASK64 = (1 << 64) - 1
+CHUNK = 1 << 16          # estados por lectura/escritura de archivo
+ITEM = array("Q").itemsize
+
+def _blank(b):
+    """Posición del hueco en un tablero de 64 bits (el nibble en 0)."""
+    return 15 - format(b, "016x").index("0")
+
+def _leer(ruta):
+    """Genera los estados de un archivo de capa/corrida, por bloques."""
+    with open(ruta, "rb") as f:
+        while True:
+            a = array("Q")
+            try:
+                a.fromfile(f, CHUNK)
+            except EOFError:      # último bloque incompleto (ya quedó en 'a')
+                pass
+            if not a:
+                return
+            yield from a
+
+class _Escritor:
+    """Escribe enteros de 64 bits en bloques."""
+    def __init__(self, ruta):
+        self.f = open(ruta, "wb")
+        self.buf = array("Q")
+        self.n = 0
+
+    def add(self, x):
+        self.buf.append(x)
+        self.n += 1
+        if len(self.buf) >= CHUNK:
+            self.buf.tofile(self.f)
+            self.buf = array("Q")
+
+    def close(self):
+        self.buf.tofile(self.f)
+        self.f.close()
+
+def _contiene(mm, n, x):
+    """Búsqueda binaria de x en un archivo de capa mapeado (n estados)."""
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        v = int.from_bytes(mm[mid * ITEM:(mid + 1) * ITEM], "little")
+        if v < x:
+            lo = mid + 1
+        elif v > x:
+            hi = mid
+        else:
+            return True
+    return False
+
+def _sin_repetidos_ni(stream, previas):
+    """
+    Recorre 'stream' (ordenado, con repetidos) y deja pasar cada valor una vez
+    y solo si no aparece en ninguno de los flujos ordenados de 'previas'.
+    """
+    previas = [iter(p) for p in previas]
+    actuales = [next(p, None) for p in previas]
+    ultimo = None
+    for x in stream:
+        if x == ultimo:
+            continue
+        ultimo = x
+        repetido = False
+        for k, p in enumerate(previas):
+            while actuales[k] is not None and actuales[k] < x:
+                actuales[k] = next(p, None)
+            if actuales[k] == x:
+                repetido = True
+        if not repetido:
+            yield x
+
+def solve_bfs_disk(start, workdir, ram_states=1_000_000, max_depth=None, stop_at_goal=True,
+                   keep_files=False, obs=None):
+    """
+    BFS por capas en disco. Regresa el dict de puzzle.solve_bfs más 'layers'
+    (tamaño de cada capa = distribución de profundidades).
+    - ram_states: tamaño del buffer de sucesores en memoria
+    - max_depth : última capa a generar (None = hasta encontrar / agotar)
+    - stop_at_goal=False: sigue hasta max_depth para contar capas completas
+    - keep_files=False: borra las capas y, si esta llamada creó workdir, también
+      el directorio
+    """
+    if not isinstance(start, int) and len(start) != 16:
+        raise ValueError("La BFS en disco solo está implementada para 4x4.")
+    t0 = time.time()
+    dir_nuevo = not os.path.isdir(workdir)
+    os.makedirs(workdir, exist_ok=True)
+    capa = lambda d: os.path.join(workdir, f"capa_{d:03d}.bin")
+    start = puzzle.as_packed(start) & MASK64
+    goal = puzzle.GOAL_PACKED & MASK64
+
+    w = _Escritor(capa(0))
+    w.add(start)
+    w.close()
+    layers = [1]
+    expanded = generated = 0
+    found_at = 0 if start == goal else None
+    if obs is not None:
+        obs.inicio("BFS disco")
+
+    d = 0
+    while layers[d] and (found_at is None or not stop_at_goal) and \
+            (max_depth is None or d < max_depth):
+        # 1) Expandir la capa d en corridas ordenadas de a lo más ram_states
+        corridas, buf = [], []
+        def volcar():
+            ruta = os.path.join(workdir, f"corrida_{d:03d}_{len(corridas):05d}.bin")
+            with open(ruta, "wb") as f:
+                array("Q", sorted(set(buf))).tofile(f)
+            corridas.append(ruta)
+            buf.clear()
+        for b in _leer(capa(d)):
+            ops = puzzle.neighbors_packed(b | _blank(b) << puzzle.BLANK_SHIFT)
+            generated += len(ops)
+            for _, ns in ops:
+                buf.append(ns & MASK64)
+            expanded += 1
+            if len(buf) >= ram_states:
+                volcar()
+        if buf:
+            volcar()
+
+        # 2) Mezclar corridas y quitar lo que ya está en las capas d y d-1
+        previas = [_leer(capa(d))] + ([_leer(capa(d - 1))] if d > 0 else [])
+        w = _Escritor(capa(d + 1))
+        for x in _sin_repetidos_ni(heapq.merge(*[_leer(r) for r in corridas]), previas):
+            w.add(x)
+            if x == goal and found_at is None:
+                found_at = d + 1
+        w.close()
+        for r in corridas:
+            os.remove(r)
+        layers.append(w.n)
+        d += 1
+        if obs is not None:
+            obs.capa(d, expanded, generated, 0, w.n, sum(layers))
+
+    path = None
+    if found_at is not None:
+        path = _recuperar_ruta(goal, found_at, capa)
+    if not keep_files:
+        for k in range(len(layers)):
+            if os.path.exists(capa(k)):
+                os.remove(capa(k))
+        if dir_nuevo:
+            try:
+                os.rmdir(workdir)
+            except OSError:   # alguien dejó otros archivos ahí: no se tocan
+                pass
+    if layers and layers[-1] == 0:
+        layers.pop()
+    if obs is not None:
+        obs.fin(expanded, generated, 0, layers[-1], sum(layers), found_at is not None)
+    return dict(algo="BFS-disco", path=path, expanded=expanded, time=time.time()-t0,
+                layers=layers)
+
+def _recuperar_ruta(goal, depth, capa):
+    """
+    Desde el objetivo en la capa 'depth' busca un vecino en la capa anterior,
+    y así hasta la capa 0. Las acciones se invierten para ir de inicio a meta.
+    """
+    path = []
+    s = goal
+    for d in range(depth - 1, -1, -1):
+        with open(capa(d), "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        n = len(mm) // ITEM
+        for a, ns in puzzle.neighbors_packed(s | _blank(s) << puzzle.BLANK_SHIFT):
+            ns &= MASK64
+            if _contiene(mm, n, ns):
+                path.append(puzzle.INVERSE[a])   # de ns se llega a s con la inversa
+                s = ns
+                break
+        mm.close()
+    path.reverse()
+    return path
@@ -1,138 +1,509 @@
-import heapq
-
-# Define el tamaño del tablero (4x4)
-N = 4
-
-# Define la configuración objetivo
-GOAL_STATE = tuple(range(1, N*N)) + (0,)
-
-class Node:
-    """
-    Clase para representar un estado del puzzle (un nodo en el árbol de búsqueda).
-    """
-    def __init__(self, board, g=0, parent=None):
-        self.board = board  # Tupla que representa el tablero
-        self.parent = parent
-        self.g = g # Costo desde el inicio
-        self.h = self.calculate_manhattan_distance() # Heurística
-        self.f = self.g + self.h # Costo total estimado
-
-    def calculate_manhattan_distance(self):
-        """Calcula la distancia de Manhattan total para el tablero actual."""
-        distance = 0
-        for i in range(N * N):
-            if self.board[i] == 0:
-                continue
-            
-            # Posición actual (fila, columna)
-            current_row, current_col = divmod(i, N)
-            
-            # Posición objetivo (fila, columna)
-            # El valor de la pieza - 1 nos da su índice objetivo
-            goal_index = self.board[i] - 1
-            goal_row, goal_col = divmod(goal_index, N)
-            
-            distance += abs(current_row - goal_row) + abs(current_col - goal_col)
-        return distance
-
-    def get_successors(self):
-        """Genera todos los posibles estados sucesores a partir del estado actual."""
-        successors = []
-        empty_index = self.board.index(0)
-        row, col = divmod(empty_index, N)
-
-        # Movimientos posibles: Arriba, Abajo, Izquierda, Derecha
-        # (cambio_fila, cambio_columna)
-        moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        for dr, dc in moves:
-            new_row, new_col = row + dr, col + dc
-
-            if 0 <= new_row < N and 0 <= new_col < N:
-                new_board = list(self.board)
-                new_index = new_row * N + new_col
-                
-                # Intercambiar el espacio vacío con la pieza adyacente
-                new_board[empty_index], new_board[new_index] = new_board[new_index], new_board[empty_index]
-                
-                successors.append(Node(tuple(new_board), self.g + 1, self))
-        return successors
-
-    # Métodos para que la cola de prioridad (heapq) pueda comparar nodos
-    def __lt__(self, other):
-        return self.f < other.f
-    
-    # Método para que el conjunto (closed_list) pueda hashear el tablero
-    def __hash__(self):
-        return hash(self.board)
-
-def print_board(board_tuple):
-    """Imprime el tablero en un formato legible."""
-    for i in range(N):
-        row = board_tuple[i*N : (i+1)*N]
-        print(" ".join(f"{num:2}" if num != 0 else "  " for num in row))
-    print("-" * (N * 3))
-
-def print_solution(node):
-    """Imprime la secuencia de movimientos desde el inicio hasta la solución."""
-    path = []
-    current = node
-    while current:
-        path.append(current.board)
-        current = current.parent
-    
-    step = 0
-    for board in reversed(path):
-        print(f"Paso {step}:")
-        print_board(board)
-        step += 1
-
-def a_star_search(initial_board):
-    """
-    Implementación del algoritmo A* para resolver el 15-puzzle.
-    """
-    start_node = Node(initial_board)
-    
-    # La open_list es una cola de prioridad (min-heap) que ordena por f(n)
-    open_list = [start_node]
-    heapq.heapify(open_list)
-    
-    # La closed_list es un conjunto para búsquedas rápidas de estados ya visitados
-    closed_list = set()
-
-    while open_list:
-        # Extraer el nodo con el menor costo f
-        current_node = heapq.heappop(open_list)
-
-        if current_node.board == GOAL_STATE:
-            print(f"¡Solución encontrada en {current_node.g} movimientos!")
-            print_solution(current_node)
-            return
-
-        if current_node.board in closed_list:
-            continue
-
-        closed_list.add(current_node.board)
-
-        for successor in current_node.get_successors():
-            if successor.board not in closed_list:
-                heapq.heappush(open_list, successor)
-    
-    print("No se encontró una solución.")
-
-# --- Programa Principal ---
-if __name__ == "__main__":
-    # Tablero inicial (representado como una tupla)
-    # 0 es el espacio vacío.
-    # Este ejemplo es resoluble y tiene una solución corta.
-    initial_board = (
-        1, 2, 3, 4,
-        5, 6, 0, 8,
-        9, 10, 7, 12,
-        13, 14, 11, 15
-    )
-    
-    print("Estado Inicial:")
-    print_board(initial_board)
-    
-    a_star_search(initial_board)
\ No newline at end of file
+import heapq
+import time
+
+import puzzle
+
+# Tamaño por defecto del tablero (4x4); 3x3 y 5x5 se deducen del largo de la tupla
+N = puzzle.N
+
+# Configuración objetivo del 4x4. Solo es un alias de compatibilidad: los
+# algoritmos toman la meta y las tablas del tamaño de cada tablero con
+# puzzle.board_tables(estado).
+GOAL_STATE = puzzle.GOAL
+
+# Acción que deshace a cada acción (para no regresar al padre)
+INVERSE = {"U": "D", "D": "U", "L": "R", "R": "L", None: None}
+
+# ARA*: peso inicial por tamaño. En 5x5 profundos, con w = 3 la primera
+# solución puede tardar más de 30 s; por eso ahí además se empieza con una
+# vuelta voraz (ordena casi solo por h), que da una solución en ~1 s.
+ARA_W0 = {3: 2.0, 4: 3.0, 5: 5.0}
+ARA_VORAZ = 1e6      # peso que usa la vuelta voraz
+
+class Node:
+    """
+    Clase para representar un estado del puzzle (un nodo en el árbol de búsqueda).
+    El tamaño del tablero (3x3, 4x4 o 5x5) se deduce del largo de 'board'.
+    Con __slots__ y sin guardar f (se calcula de g + h) cada nodo pesa mucho
+    menos; 'h' se puede pasar ya calculada (p. ej. actualizada solo con la
+    pieza que se movió) para no recalcularla desde cero.
+    """
+    __slots__ = ("board", "parent", "g", "h", "pdb")
+
+    def __init__(self, board, g=0, parent=None, pdb=None, h=None):
+        self.board = board  # Tupla que representa el tablero
+        self.parent = parent
+        self.pdb = pdb # PatternDatabase opcional (puzzle_pdb); si no, Manhattan
+        self.g = g # Costo desde el inicio
+        if h is not None:
+            self.h = h
+        elif pdb is not None:
+            self.h = pdb.distance(board) # Heurística de patrones aditiva
+        else:
+            self.h = self.calculate_manhattan_distance() # Heurística
+
+    @property
+    def f(self):
+        """Costo total estimado."""
+        return self.g + self.h
+
+    def calculate_manhattan_distance(self):
+        """Calcula la distancia de Manhattan total con la tabla del tamaño del tablero."""
+        table = puzzle.board_tables(self.board).manhattan
+        # table[0] es todo ceros: el hueco no suma
+        return sum(table[tile][i] for i, tile in enumerate(self.board))
+
+    def get_successors(self):
+        """Genera todos los posibles estados sucesores a partir del estado actual."""
+        successors = []
+        empty_index = self.board.index(0)
+
+        # Movimientos posibles del hueco, ya filtrados por la tabla del tamaño
+        for _, new_index in puzzle.board_tables(self.board).moves[empty_index]:
+            new_board = list(self.board)
+
+            # Intercambiar el espacio vacío con la pieza adyacente
+            new_board[empty_index], new_board[new_index] = new_board[new_index], 0
+
+            successors.append(Node(tuple(new_board), self.g + 1, self, self.pdb))
+        return successors
+
+    # Métodos para que la cola de prioridad (heapq) pueda comparar nodos
+    def __lt__(self, other):
+        return self.f < other.f
+    
+    # Método para que el conjunto (closed_list) pueda hashear el tablero
+    def __hash__(self):
+        return hash(self.board)
+
+def print_board(board_tuple):
+    """Imprime el tablero en un formato legible."""
+    n = puzzle.board_tables(board_tuple).n
+    for i in range(n):
+        row = board_tuple[i*n : (i+1)*n]
+        print(" ".join(f"{num:2}" if num != 0 else "  " for num in row))
+    print("-" * (n * 3))
+
+def print_solution(node):
+    """Imprime la secuencia de movimientos desde el inicio hasta la solución."""
+    path = []
+    current = node
+    while current:
+        path.append(current.board)
+        current = current.parent
+    
+    step = 0
+    for board in reversed(path):
+        print(f"Paso {step}:")
+        print_board(board)
+        step += 1
+
+def solution_actions(node):
+    """Acciones U/D/L/R (del hueco, como en puzzle.py) desde la raíz hasta 'node'."""
+    n = puzzle.board_tables(node.board).n
+    names = {-n: "U", n: "D", -1: "L", 1: "R"}
+    actions = []
+    while node.parent is not None:
+        actions.append(names[node.board.index(0) - node.parent.board.index(0)])
+        node = node.parent
+    actions.reverse()
+    return actions
+
+def a_star_search(initial_board, pdb=None, verbose=True, obs=None):
+    """
+    Implementación del algoritmo A* para resolver el n-puzzle (3x3, 4x4, 5x5).
+    'pdb' es una puzzle_pdb.PatternDatabase opcional (solo 4x4) en lugar de Manhattan.
+    - La lista abierta son cubetas por valor de f (f es un entero chico):
+      meter y sacar cuestan O(1) y dentro de una cubeta sale el último en
+      entrar (LIFO), que favorece a los nodos más profundos.
+    - 'best_g' guarda la mejor g de cada estado: un sucesor que no la mejora
+      se descarta antes de crear su Node. Con h consistente un estado ya
+      expandido nunca mejora, así que no hace falta lista cerrada aparte.
+    Regresa el mismo dict que puzzle.solve_bfs; con verbose=False no imprime.
+    'obs' es un instrumentacion.Observador opcional (una capa por valor de f).
+    """
+    t0 = time.time()
+    tables = puzzle.board_tables(initial_board)
+    if pdb is not None and tables.n != 4:
+        raise ValueError("Las PDB de puzzle_pdb son solo para 4x4.")
+    goal, moves, manhattan = tables.goal, tables.moves, tables.manhattan
+    expanded = generated = duplicates = 0
+    start_node = Node(tuple(initial_board), pdb=pdb)
+    best_g = {start_node.board: 0}
+
+    # buckets[f] = pila de nodos con ese f; 'f_min' nunca pasa del menor f no vacío
+    f_min = start_node.h
+    buckets = [[] for _ in range(f_min + 1)]
+    buckets[f_min].append(start_node)
+    open_size = 1
+    if obs is not None:
+        obs.inicio("A*")
+        layer_f = f_min
+
+    while open_size:
+        # Extraer un nodo con el menor costo f
+        while not buckets[f_min]:
+            f_min += 1
+        current_node = buckets[f_min].pop()
+        open_size -= 1
+        if obs is not None and f_min != layer_f:
+            obs.capa(layer_f, expanded, generated, duplicates, open_size, len(best_g))
+            layer_f = f_min
+
+        board, g = current_node.board, current_node.g
+        if g != best_g[board]:
+            duplicates += 1   # entrada vieja: el estado ya se alcanzó con menor g
+            continue
+
+        if board == goal:
+            if verbose:
+                print(f"¡Solución encontrada en {g} movimientos!")
+                print_solution(current_node)
+            if obs is not None:
+                obs.fin(expanded, generated, duplicates, open_size, len(best_g), True)
+            return dict(algo="A*", path=solution_actions(current_node),
+                        expanded=expanded, time=time.time()-t0)
+        expanded += 1
+
+        blank = board.index(0)
+        ng = g + 1
+        h = current_node.h
+        for _, nb in moves[blank]:
+            generated += 1
+            l = list(board)
+            tile = l[nb]
+            l[blank], l[nb] = tile, 0
+            child = tuple(l)
+            if ng >= best_g.get(child, ng + 1):
+                duplicates += 1   # no mejora: se descarta sin crear el Node
+                continue
+            best_g[child] = ng
+            if pdb is None:
+                node = Node(child, ng, current_node, None,
+                            h - manhattan[tile][nb] + manhattan[tile][blank])
+            else:
+                node = Node(child, ng, current_node, pdb)
+            f = ng + node.h
+            if f >= len(buckets):
+                buckets.extend([] for _ in range(f + 1 - len(buckets)))
+            buckets[f].append(node)
+            open_size += 1
+            if f < f_min:     # solo con heurísticas inconsistentes
+                f_min = f
+
+    if verbose:
+        print("No se encontró una solución.")
+    if obs is not None:
+        obs.fin(expanded, generated, duplicates, 0, len(best_g), False)
+    return dict(algo="A*", path=None, expanded=expanded, time=time.time()-t0)
+
+def ida_star_search(initial_board, max_bound=None, pdb=None, obs=None):
+    """
+    IDA*: DFS con cota sobre f = g + h que crece hasta la menor f que la superó.
+    Usa memoria fija (el tablero y la ruta actual), actualiza Manhattan sólo con
+    la pieza que se movió y descarta el movimiento que deshace el anterior.
+    Con 'pdb' (puzzle_pdb.PatternDatabase) se usa la heurística de patrones,
+    actualizando solo el índice del grupo de la pieza movida.
+    Regresa el mismo dict que puzzle.solve_bfs (algo, path, expanded, time).
+    Por defecto 'max_bound' es la solución óptima más larga conocida del
+    tamaño (31 en 3x3, 80 en 4x4; en 5x5 una cota superior).
+    'obs' es un instrumentacion.Observador opcional (una capa por cota).
+    """
+    t0 = time.time()
+    tables = puzzle.board_tables(initial_board)
+    moves, manhattan = tables.moves, tables.manhattan
+    if max_bound is None:
+        max_bound = tables.max_depth
+    if pdb is not None and tables.n != 4:
+        raise ValueError("Las PDB de puzzle_pdb son solo para 4x4.")
+    board = list(initial_board)
+    path = []
+    expanded = generated = 0
+    FOUND = -1
+
+    def search(g, h, blank, prev, bound):
+        nonlocal expanded, generated
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0:  # Manhattan 0 solo en el objetivo
+            return FOUND
+        expanded += 1
+        generated += len(moves[blank]) - (prev is not None)
+        minimo = float("inf")
+        undo = INVERSE[prev]
+        for a, nb in moves[blank]:
+            if a == undo:
+                continue
+            tile = board[nb]
+            # Solo cambia la distancia de la pieza que se desliza al hueco
+            if ids is None:
+                nh = h - manhattan[tile][nb] + manhattan[tile][blank]
+            else:
+                gi, shift = group_of[tile]
+                old = ids[gi]
+                ids[gi] = old + ((blank - nb) << shift)
+                nh = h - mm[offsets[gi] + old] + mm[offsets[gi] + ids[gi]]
+            board[blank], board[nb] = tile, 0
+            path.append(a)
+            t = search(g + 1, nh, nb, a, bound)
+            if t == FOUND:
+                return FOUND
+            path.pop()
+            board[blank], board[nb] = 0, tile
+            if ids is not None:
+                ids[gi] = old
+            if t < minimo:
+                minimo = t
+        return minimo
+
+    if pdb is None:
+        ids = None
+        h0 = sum(manhattan[tile][i] for i, tile in enumerate(board))
+    else:
+        ids = pdb.indices(board)
+        mm, offsets = pdb.mm, pdb.offsets
+        group_of = [None if x is None else (x[0], 4 * x[1]) for x in pdb.group_of]
+        h0 = pdb.value(ids)
+    blank = board.index(0)
+    bound = h0
+    if obs is not None:
+        obs.inicio("IDA*")
+    while bound <= max_bound:
+        t = search(0, h0, blank, None, bound)
+        if obs is not None:
+            # Sin tabla de cerrados: la "frontera" es la pila, a lo más 'bound'
+            obs.capa(bound, expanded, generated, 0, bound, 0)
+        if t == FOUND:
+            if obs is not None:
+                obs.fin(expanded, generated, 0, bound, 0, True)
+            return dict(algo=f"IDA*(f={bound})", path=path, expanded=expanded,
+                        time=time.time()-t0)
+        bound = t
+
+    if obs is not None:
+        obs.fin(expanded, generated, 0, 0, 0, False)
+    return dict(algo="IDA*", path=None, expanded=expanded, time=time.time()-t0)
+
+def ara_star_search(initial_board, w0=None, dw=0.5, time_limit=None, max_nodes=None,
+                    pdb=None, on_solution=None, obs=None, greedy=None):
+    """
+    A* "anytime" (estilo ARA*): busca con f = g + w*h empezando en w = w0, lo
+    que da rápido una solución a lo más w veces la óptima, y luego baja w de
+    'dw' en 'dw' reusando lo ya explorado (los estados que mejoraron estando
+    cerrados pasan a INCONS y vuelven a OPEN en la siguiente vuelta).
+    - w0=None usa ARA_W0 según el tamaño del tablero.
+    - greedy: empezar con una vuelta voraz (casi solo h) antes de w0, para
+      tener pronto una primera solución aunque sea larga (su cota sale de la
+      OPEN, no de w). None = solo en 5x5, donde w0 no basta para entregar
+      algo dentro de un presupuesto de pocos segundos.
+    Se detiene al probar la óptima (cota 1) o al agotar 'time_limit'
+    (segundos) o 'max_nodes' (expansiones).
+    Cada solución nueva se agrega a 'solutions' como dict(length, w, bound,
+    expanded, time), donde 'bound' garantiza length <= bound * óptima; si se
+    da 'on_solution' también se le llama con ese dict en cuanto aparece.
+    Regresa el dict de puzzle.solve_bfs con la mejor ruta más 'solutions' y
+    'bound' (la cota de la mejor ruta al terminar).
+    'obs' es un instrumentacion.Observador opcional (una capa por valor de w).
+    """
+    t0 = time.time()
+    tables = puzzle.board_tables(initial_board)
+    if pdb is not None and tables.n != 4:
+        raise ValueError("Las PDB de puzzle_pdb son solo para 4x4.")
+    goal, moves, manhattan = tables.goal, tables.moves, tables.manhattan
+    inf = float("inf")
+    if w0 is None:
+        w0 = ARA_W0[tables.n]
+    w0 = max(1.0, w0)
+    if greedy is None:
+        greedy = tables.n >= 5
+
+    start = tuple(initial_board)
+    g = {start: 0}
+    h = {start: pdb.distance(start) if pdb is not None else
+         sum(manhattan[tile][i] for i, tile in enumerate(start))}
+    parent = {start: None}               # estado -> (padre, acción)
+    w = ARA_VORAZ if greedy else w0
+    open_list = [(w * h[start], h[start], start)]  # (g + w*h, h, estado); desempate: menor h
+    closed, incons = set(), set()
+    expanded = generated = 0
+    solutions = []
+    best, bound = None, inf
+    if obs is not None:
+        obs.inicio("ARA*")
+
+    def out_of_budget():
+        return (max_nodes is not None and expanded >= max_nodes) or \
+               (time_limit is not None and time.time() - t0 >= time_limit)
+
+    def improve_path():
+        """Una vuelta de A* ponderado; False si se acabó el presupuesto."""
+        nonlocal expanded, generated
+        while open_list:
+            key, _, s = open_list[0]
+            if g.get(goal, inf) <= key:  # ninguna f ponderada en OPEN mejora la meta
+                return True
+            heapq.heappop(open_list)
+            if s in closed or key != g[s] + w * h[s]:
+                continue                 # entrada vieja (el estado ya mejoró)
+            if out_of_budget():
+                return False
+            closed.add(s)
+            expanded += 1
+            blank = s.index(0)
+            ng = g[s] + 1
+            for a, nb in moves[blank]:
+                generated += 1
+                l = list(s)
+                tile = l[nb]
+                l[blank], l[nb] = tile, 0
+                ns = tuple(l)
+                if ng >= g.get(ns, inf):
+                    continue
+                g[ns] = ng
+                parent[ns] = (s, a)
+                if ns not in h:
+                    h[ns] = pdb.distance(ns) if pdb is not None else \
+                        h[s] - manhattan[tile][nb] + manhattan[tile][blank]
+                if ns in closed:
+                    incons.add(ns)       # se reabre hasta la siguiente vuelta
+                else:
+                    heapq.heappush(open_list, (ng + w * h[ns], h[ns], ns))
+        return True
+
+    while True:
+        finished = improve_path()
+        if obs is not None:
+            obs.capa(w, expanded, generated, generated - len(g) + 1, len(open_list), len(closed))
+        improved = goal in g and (best is None or g[goal] < len(best))
+        if improved:
+            path = []
+            s = goal
+            while parent[s] is not None:
+                s, a = parent[s]
+                path.append(a)
+            path.reverse()
+            best = path
+        if best is not None and (finished or improved):
+            # Cota: costo / (mínima g+h sin resolver), nunca peor que w
+            pendientes = [s for _, _, s in open_list if s not in closed] + list(incons)
+            lower = min((g[s] + h[s] for s in pendientes), default=len(best))
+            new_bound = min(w, len(best) / lower) if lower > 0 else 1.0
+            if not solutions or len(best) < solutions[-1]["length"] or new_bound < bound:
+                bound = max(1.0, new_bound)
+                sol = dict(length=len(best), w=inf if w == ARA_VORAZ else w, bound=bound,
+                           expanded=expanded, time=time.time() - t0)
+                solutions.append(sol)
+                if on_solution is not None:
+                    on_solution(sol)
+        if not finished or bound <= 1.0 or out_of_budget() or \
+                (w <= 1.0 and not open_list and not incons):
+            break
+        # Siguiente vuelta: w más chica, OPEN ∪ INCONS reordenado, CLOSED vacío
+        w = w0 if w == ARA_VORAZ else max(1.0, w - dw)
+        pendientes = {s for _, _, s in open_list if s not in closed} | incons
+        open_list[:] = [(g[s] + w * h[s], h[s], s) for s in pendientes]
+        heapq.heapify(open_list)
+        closed.clear()
+        incons.clear()
+
+    if obs is not None:
+        obs.fin(expanded, generated, generated - len(g) + 1, len(open_list), len(closed),
+                best is not None)
+    if solutions:
+        w = solutions[-1]["w"]
+    return dict(algo=f"ARA*(w={w:g})", path=best, expanded=expanded,
+                time=time.time()-t0, solutions=solutions,
+                bound=bound if best is not None else None)
+
+# --- Programa Principal ---
+if __name__ == "__main__":
+    import argparse, sys
+    from puzzle import parse_state, scramble_from_goal, SIZES
+
+    ap = argparse.ArgumentParser(description="n-puzzle con búsqueda informada (A* / IDA* / ARA*)")
+    ap.add_argument("--algo", choices=["astar", "idastar", "arastar"], default="astar",
+                    help="A* con heap (por defecto), IDA* de memoria fija o ARA* anytime")
+    ap.add_argument("--pdb", type=str, default=None,
+                    help="Archivo de puzzle_pdb.py para usar patrones en lugar de Manhattan")
+    ap.add_argument("--start", type=str, help="Estado inicial: n*n números separados por espacio")
+    ap.add_argument("--size", type=int, choices=SIZES, default=None,
+                    help="Tamaño del tablero (por defecto, el que indique --start); "
+                         "sin --start se revuelve uno de ese tamaño")
+    ap.add_argument("--scramble", type=int, default=None,
+                    help="Sin --start: movimientos aleatorios desde el objetivo (12 si solo se da --size)")
+    ap.add_argument("--seed", type=int, default=None, help="Semilla aleatoria (reproducible)")
+    ap.add_argument("--weight", type=float, default=None,
+                    help="Peso inicial w de ARA* (la primera solución es <= w * óptima); "
+                         "por defecto depende del tamaño (ARA_W0)")
+    ap.add_argument("--weight-step", type=float, default=0.5,
+                    help="Cuánto baja w en cada vuelta de ARA*")
+    ap.add_argument("--time-limit", type=float, default=None,
+                    help="Segundos máximos para ARA* (regresa la mejor solución hasta ahí)")
+    ap.add_argument("--max-nodes", type=int, default=None,
+                    help="Expansiones máximas para ARA*")
+    ap.add_argument("--stats", type=str, default=None,
+                    help="Guarda la instrumentación (por capa de f) en este JSON")
+    ap.add_argument("--progress", type=float, default=None,
+                    help="Imprime una línea de avance cada tantos segundos")
+    args = ap.parse_args()
+
+    obs = None
+    if args.stats or args.progress is not None:
+        from instrumentacion import Observador
+        obs = Observador(progreso=args.progress)
+
+    # Tablero inicial (representado como una tupla)
+    # 0 es el espacio vacío.
+    # Este ejemplo es resoluble y tiene una solución corta.
+    initial_board = (
+        1, 2, 3, 4,
+        5, 6, 0, 8,
+        9, 10, 7, 12,
+        13, 14, 11, 15
+    )
+    if args.start:
+        initial_board = parse_state(args.start, args.size)
+    elif args.size is not None or args.scramble is not None:
+        initial_board = scramble_from_goal(12 if args.scramble is None else args.scramble,
+                                           args.seed, n=args.size or N)
+    pdb = None
+    if args.pdb:
+        from puzzle_pdb import PatternDatabase
+        try:
+            pdb = PatternDatabase(args.pdb)
+        except (OSError, ValueError) as e:
+            ap.error(f"--pdb: {e}")
+        n = puzzle.board_tables(initial_board).n
+        if n != pdb.n:
+            ap.error(f"--pdb {args.pdb} es para tableros {pdb.n}x{pdb.n} "
+                     f"y el tablero es {n}x{n}.")
+    
+    print("Estado Inicial:")
+    print_board(initial_board)
+
+    # Igual que puzzle.py: con un estado no resoluble no tiene caso buscar
+    if not puzzle.is_solvable(initial_board):
+        n = puzzle.board_tables(initial_board).n
+        print(f"\n⚠️  Ese estado NO es resoluble para {n}×{n}.", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.algo == "astar":
+        a_star_search(initial_board, pdb=pdb, obs=obs)
+    else:
+        if args.algo == "idastar":
+            res = ida_star_search(initial_board, pdb=pdb, obs=obs)
+        else:
+            def report(sol):
+                print(f"  w={sol['w']:g}: {sol['length']} movimientos (<= {sol['bound']:.3f} x óptima)"
+                      f"  t={sol['time']:.3f}s  nodos={sol['expanded']}", flush=True)
+            res = ara_star_search(initial_board, args.weight, args.weight_step, args.time_limit,
+                                  args.max_nodes, pdb=pdb, on_solution=report, obs=obs)
+        print(f"[{res['algo']}]  tiempo={res['time']:.3f}s  nodos≈{res['expanded']}")
+        if res["path"] is None:
+            print("No se encontró una solución.")
+        else:
+            print(f"¡Solución encontrada en {len(res['path'])} movimientos!")
+            print("Secuencia:", " ".join(res["path"]))
+    if args.stats:
+        obs.guardar(args.stats)
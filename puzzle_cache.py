@@ -0,0 +1,143 @@
+# ------------------------------------------------------------
+# Caché persistente de soluciones del n-puzzle (sqlite).
+#
+#   - Clave canónica: el menor entre el estado y su reflejo en la diagonal
+#     principal. Reflejar mueve la casilla (r, c) a (c, r) y además cambia
+#     el nombre de cada pieza por la que ocupa su casilla reflejada en la
+#     meta, así la meta es su propio reflejo y las rutas se traducen
+#     cambiando U<->L y D<->R. Un tablero y su espejo comparten entrada.
+#   - Al guardar una solución ÓPTIMA se guardan también todos los estados
+#     de la ruta: cada sufijo de una ruta óptima también es óptimo.
+#   - Desalojo LRU: cada consulta acertada actualiza 'usado'; si hay más de
+#     max_entries entradas se borran las menos usadas recientemente.
+#
+#   cache = SolutionCache("soluciones.sqlite")
+#   res = cache.solve(start, puzzle.solve_bfs)   # la 2a vez es una consulta
+# ------------------------------------------------------------
+
+import sqlite3, time
+
+import puzzle
+
+# Acción equivalente en el tablero reflejado
+REFLECT_ACTION = {"U": "L", "L": "U", "D": "R", "R": "D"}
+
+# Por tamaño: (casilla reflejada de cada casilla, nuevo nombre de cada pieza)
+_REFLECT = {}
+for _n in puzzle.SIZES:
+    _tr = [c * _n + r for r, c in puzzle.TABLES[_n].rc]
+    _REFLECT[_n] = (_tr, [0] + [_tr[p - 1] + 1 for p in range(1, _n * _n)])
+
+def reflect(state):
+    """Reflejo de un estado en la diagonal principal (con piezas renombradas)."""
+    tr, rl = _REFLECT[puzzle.board_tables(state).n]
+    out = [0] * len(state)
+    for i, x in enumerate(state):
+        out[tr[i]] = rl[x]
+    return tuple(out)
+
+def canonical(state):
+    """(estado_canónico, reflejado): el menor entre el estado y su reflejo."""
+    r = reflect(state)
+    return (r, True) if r < state else (state, False)
+
+class SolutionCache:
+    """
+    Soluciones óptimas por estado canónico en un archivo sqlite. Lo pueden
+    abrir varios procesos a la vez (modo WAL).
+      - max_entries: tamaño máximo (en estados) antes de desalojar por LRU
+    """
+    def __init__(self, path="soluciones.sqlite", max_entries=1_000_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS soluciones ("
+                        "clave BLOB PRIMARY KEY, ruta TEXT NOT NULL, usado REAL NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS soluciones_usado ON soluciones(usado)")
+        self.db.commit()
+        self._count = len(self)
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM soluciones").fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, state):
+        """Lista de acciones óptima para 'state', o None si no está."""
+        state = self._as_tuple(state)
+        if state == puzzle.board_tables(state).goal:
+            return []
+        key, reflected = canonical(state)
+        row = self.db.execute("SELECT ruta FROM soluciones WHERE clave = ?",
+                              (bytes(key),)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.db.execute("UPDATE soluciones SET usado = ? WHERE clave = ?",
+                        (time.time(), bytes(key)))
+        self.db.commit()
+        path = list(row[0])
+        return [REFLECT_ACTION[a] for a in path] if reflected else path
+
+    def put(self, state, path):
+        """
+        Guarda una ruta ÓPTIMA de 'state' a la meta y la de cada estado
+        intermedio (su sufijo). Las claves que ya estaban no se tocan.
+        """
+        state = self._as_tuple(state)
+        succ = puzzle.board_tables(state).neighbors
+        now = time.time()
+        rows = []
+        s = state
+        for k, a in enumerate(path):
+            key, reflected = canonical(s)
+            rest = path[k:]
+            if reflected:
+                rest = [REFLECT_ACTION[x] for x in rest]
+            rows.append((bytes(key), "".join(rest), now))
+            s = dict(succ(s))[a]
+        cur = self.db.executemany(
+            "INSERT OR IGNORE INTO soluciones (clave, ruta, usado) VALUES (?, ?, ?)", rows)
+        self.db.commit()
+        self._count += max(cur.rowcount, 0)
+        if self._count > self.max_entries:
+            self._evict()
+
+    def _evict(self):
+        """Borra las entradas usadas hace más tiempo hasta quedar en max_entries."""
+        self._count = len(self)   # otros procesos pudieron agregar o borrar
+        extra = self._count - self.max_entries
+        if extra > 0:
+            self.db.execute("DELETE FROM soluciones WHERE clave IN "
+                            "(SELECT clave FROM soluciones ORDER BY usado LIMIT ?)", (extra,))
+            self.db.commit()
+            self._count -= extra
+
+    def solve(self, state, solver, optimal=True):
+        """
+        Consulta la caché y, si no está, llama solver(state) (cualquier
+        resolutor que regrese el dict de puzzle.solve_bfs) y guarda la ruta
+        si el resolutor es óptimo. Un acierto regresa algo="caché".
+        """
+        t0 = time.time()
+        path = self.get(state)
+        if path is not None:
+            return dict(algo="caché", path=path, expanded=0, time=time.time()-t0)
+        res = solver(state)
+        if optimal and res["path"] is not None:
+            self.put(state, res["path"])
+        return res
+
+    @staticmethod
+    def _as_tuple(state):
+        return puzzle.unpack(state) if isinstance(state, int) else tuple(state)
@@ -0,0 +1,297 @@
+# ------------------------------------------------------------
+# A* paralelo con distribución por hash (estilo HDA*).
+#
+#   - Cada proceso trabajador es DUEÑO de los estados con hash(estado) % k
+#     igual a su número: solo él guarda su mejor g, su padre y lo mete a su
+#     propia lista abierta (heap). La heurística es la de Node (Manhattan,
+#     o la PDB de puzzle_pdb si se da).
+#   - Al expandir, los sucesores de otros dueños se juntan por destino y se
+#     mandan en lotes por multiprocessing.Queue.
+#   - Incumbente: el costo de la mejor solución vista (memoria compartida);
+#     nadie expande nodos con f >= costo. Con h consistente, cuando todos
+#     están ociosos y no hay mensajes en tránsito, ese costo es el óptimo.
+#   - Terminación: cada trabajador suma lo enviado y lo recibido y marca si
+#     está ocioso, todo bajo un mismo candado; el coordinador toma una foto
+#     de esos contadores y termina si todos están ociosos y
+#     enviados == recibidos (no queda nada en las colas).
+#   - La ruta se arma al final preguntando a cada dueño por el padre.
+#   - Si un trabajador falla, su excepción llega por la cola de resultados y
+#     se vuelve a lanzar en el coordinador; si muere sin avisar (OOM, señal)
+#     se lanza RuntimeError. En ambos casos se terminan los demás procesos.
+#
+#   python puzzle_hda.py --workers 8 --scramble 60 --seed 1
+# ------------------------------------------------------------
+
+import argparse, heapq, multiprocessing, pickle, queue, time
+
+import puzzle
+from puzzle_busqueda_informada import Node
+
+INF = 1 << 30
+
+# ===== 1) Proceso trabajador =====
+def _worker(i, k, inboxes, results, *args):
+    """Corre el trabajador; si falla, manda la excepción al coordinador."""
+    try:
+        _trabajar(i, k, inboxes, results, *args)
+    except BaseException as e:
+        try:
+            pickle.dumps(e)
+        except Exception:
+            e = RuntimeError(f"{type(e).__name__}: {e}")
+        results.put(("error", i, e))
+
+def _trabajar(i, k, inboxes, results, lock, sent, recv, idle, cost, goal, pdb_path, batch):
+    pdb = None
+    if pdb_path:
+        from puzzle_pdb import PatternDatabase
+        pdb = PatternDatabase(pdb_path)
+    moves = puzzle.board_tables(goal).moves
+    inbox = inboxes[i]
+    best_g = {}          # estado -> mejor g conocida (solo estados de este dueño)
+    parent = {}          # estado -> (padre, acción)
+    open_list = []       # (f, -g, contador, Node): desempate hacia lo más profundo
+    out = [[] for _ in range(k)]   # lotes pendientes por destino
+    expanded = generated = 0
+    tick = 0
+
+    def receive(board, g, prev, action):
+        nonlocal tick
+        if g >= best_g.get(board, INF):
+            return
+        node = Node(board, g, pdb=pdb)
+        if node.f >= cost.value:
+            return
+        best_g[board] = g
+        parent[board] = (prev, action)
+        if board == goal:
+            with lock:
+                if g < cost.value:
+                    cost.value = g
+            return
+        tick += 1
+        heapq.heappush(open_list, (node.f, -g, tick, node))
+
+    def flush():
+        for j, lote in enumerate(out):
+            if lote:
+                with lock:
+                    sent[i] += len(lote)    # antes de encolar: así nunca parece vacío
+                inboxes[j].put(("nodos", lote))
+                out[j] = []
+
+    def handle(msg):
+        """Atiende un mensaje; regresa False cuando ya terminó la búsqueda."""
+        if msg[0] == "nodos":
+            with lock:
+                idle[i] = 0
+                recv[i] += len(msg[1])
+            for item in msg[1]:
+                receive(*item)
+            return True
+        return False     # "fin"
+
+    running = True
+    while running:
+        # Primero lo que llegó de otros trabajadores (sin bloquear)
+        try:
+            while running:
+                running = handle(inbox.get_nowait())
+        except queue.Empty:
+            pass
+        if not running:
+            break
+
+        # Expandir un puñado de nodos propios
+        for _ in range(64):
+            if not open_list or open_list[0][0] >= cost.value:
+                break
+            _, _, _, node = heapq.heappop(open_list)
+            board, g = node.board, node.g
+            if g > best_g[board]:
+                continue     # entrada vieja: ya se llegó con menor g
+            expanded += 1
+            z = board.index(0)
+            for action, nz in moves[z]:
+                l = list(board)
+                l[z], l[nz] = l[nz], 0
+                child = tuple(l)
+                generated += 1
+                j = hash(child) % k
+                if j == i:
+                    receive(child, g + 1, board, action)
+                else:
+                    out[j].append((child, g + 1, board, action))
+                    if len(out[j]) >= batch:
+                        flush()
+
+        if not open_list or open_list[0][0] >= cost.value:
+            # Sin trabajo útil: mandar lo pendiente, marcarse ocioso y esperar
+            flush()
+            with lock:
+                idle[i] = 1
+            try:
+                running = handle(inbox.get(timeout=0.01))
+            except queue.Empty:
+                pass
+        elif any(out):
+            flush()
+
+    # Búsqueda terminada: reportar contadores y contestar por padres
+    results.put(("stats", i, expanded, generated))
+    while True:
+        msg = inbox.get()
+        if msg[0] == "padre":
+            results.put(("padre",) + parent.get(msg[1], (None, None)))
+        elif msg[0] == "salir":
+            break
+    if pdb is not None:
+        pdb.close()
+
+# ===== 2) Coordinador =====
+def _recibir(results, procs, espera=0.1):
+    """
+    results.get() que no espera para siempre: si llega un error de un
+    trabajador lo vuelve a lanzar, y si un proceso murió sin avisar (OOM,
+    señal) lanza RuntimeError.
+    """
+    while True:
+        try:
+            msg = results.get(timeout=espera)
+        except queue.Empty:
+            muertos = [i for i, p in enumerate(procs) if not p.is_alive()]
+            if not muertos:
+                continue
+            try:     # su error pudo quedar en camino
+                msg = results.get(timeout=0.5)
+            except queue.Empty:
+                i = muertos[0]
+                raise RuntimeError(f"El trabajador {i} terminó inesperadamente "
+                                   f"(código {procs[i].exitcode}).") from None
+        if msg[0] == "error":
+            raise msg[2]
+        return msg
+
+def hda_star_search(initial_board, workers=4, pdb_path=None, batch=64, obs=None):
+    """
+    A* distribuido en 'workers' procesos. Regresa el dict de puzzle.solve_bfs
+    más 'per_worker': lista de dict(expanded, generated) por trabajador, para
+    ver qué tan parejo quedó el reparto.
+    - pdb_path: archivo de puzzle_pdb.py (cada trabajador lo abre con mmap)
+    - batch   : estados por mensaje entre trabajadores
+    'obs' es un instrumentacion.Observador opcional (solo totales al final).
+    """
+    t0 = time.time()
+    start = tuple(initial_board)
+    tables = puzzle.board_tables(start)
+    if pdb_path and tables.n != 4:
+        raise ValueError("Las PDB de puzzle_pdb son solo para 4x4.")
+    goal, k = tables.goal, workers
+    if obs is not None:
+        obs.inicio(f"HDA*(k={k})")
+    if start == goal:
+        if obs is not None:
+            obs.fin(0, 0, 0, 0, 0, True)
+        return dict(algo=f"HDA*(k={k})", path=[], expanded=0, time=time.time()-t0,
+                    per_worker=[dict(expanded=0, generated=0)] * k)
+
+    ctx = multiprocessing.get_context()
+    lock = ctx.Lock()
+    sent = ctx.Array("q", k + 1, lock=False)   # la casilla k es el coordinador
+    recv = ctx.Array("q", k, lock=False)
+    idle = ctx.Array("b", k, lock=False)
+    cost = ctx.Value("i", INF, lock=False)
+    inboxes = [ctx.Queue() for _ in range(k)]
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, daemon=True,
+                         args=(i, k, inboxes, results, lock, sent, recv, idle, cost,
+                               goal, pdb_path, batch)) for i in range(k)]
+    for p in procs:
+        p.start()
+
+    owner = lambda s: hash(s) % k
+    sent[k] = 1
+    inboxes[owner(start)].put(("nodos", [(start, 0, None, None)]))
+    terminado = False
+    try:
+        # Esperar a que todos estén ociosos sin mensajes en tránsito
+        while True:
+            time.sleep(0.005)
+            with lock:
+                done = all(idle) and sum(sent) == sum(recv)
+            if done:
+                break
+            # Mientras se busca solo llegan errores: si hay algo, o murió alguien, se lanza
+            if not results.empty() or not all(p.is_alive() for p in procs):
+                _recibir(results, procs)
+        for box in inboxes:
+            box.put(("fin",))
+        per_worker = [None] * k
+        for _ in range(k):
+            _, i, e, g = _recibir(results, procs)
+            per_worker[i] = dict(expanded=e, generated=g)
+
+        path = None
+        if cost.value < INF:
+            path, s = [], goal
+            while s != start:
+                inboxes[owner(s)].put(("padre", s))
+                _, s, a = _recibir(results, procs)
+                path.append(a)
+            path.reverse()
+        terminado = True
+    finally:
+        if terminado:
+            for box in inboxes:
+                box.put(("salir",))
+        else:      # error o interrupción: nadie va a contestar, se terminan ya
+            for p in procs:
+                p.terminate()
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+                p.join()
+
+    expanded = sum(w["expanded"] for w in per_worker)
+    if obs is not None:
+        obs.fin(expanded, sum(w["generated"] for w in per_worker), 0, 0, 0, path is not None)
+    return dict(algo=f"HDA*(k={k})", path=path, expanded=expanded, time=time.time()-t0,
+                per_worker=per_worker)
+
+# ===== 3) CLI =====
+def main():
+    ap = argparse.ArgumentParser(description="n-puzzle con A* paralelo distribuido por hash")
+    ap.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    ap.add_argument("--start", type=str, help="Estado inicial: n*n números separados por espacio")
+    ap.add_argument("--size", type=int, choices=puzzle.SIZES, default=None,
+                    help="Tamaño del tablero (por defecto 4, o el que indique --start)")
+    ap.add_argument("--scramble", type=int, default=30,
+                    help="Número de movimientos aleatorios desde el objetivo")
+    ap.add_argument("--seed", type=int, default=None, help="Semilla aleatoria (reproducible)")
+    ap.add_argument("--pdb", type=str, default=None,
+                    help="Archivo de puzzle_pdb.py para usar patrones en lugar de Manhattan")
+    ap.add_argument("--batch", type=int, default=64, help="Estados por mensaje entre procesos")
+    args = ap.parse_args()
+
+    if args.start:
+        start = puzzle.parse_state(args.start, args.size)
+    else:
+        start = puzzle.scramble_from_goal(args.scramble, args.seed, n=args.size or puzzle.N)
+    print("Estado inicial:")
+    print(puzzle.pretty(start))
+    if not puzzle.is_solvable(start):
+        raise SystemExit("Ese estado NO es resoluble.")
+
+    res = hda_star_search(start, args.workers, args.pdb, args.batch)
+    print(f"\n[{res['algo']}]  tiempo={res['time']:.3f}s  nodos≈{res['expanded']}")
+    for i, w in enumerate(res["per_worker"]):
+        print(f"  trabajador {i}: {w['expanded']} expandidos, {w['generated']} generados")
+    if res["path"] is None:
+        print("No se encontró solución.")
+        return
+    print(f"Longitud de solución: {len(res['path'])} movimientos")
+    print("Secuencia:", " ".join(res["path"]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# ------------------------------------------------------------
+# Base de datos de patrones (PDB) aditiva y disjunta para el 15-puzzle.
+#
+#   - Las piezas 1..15 se reparten en grupos disjuntos (p. ej. 5-5-5, 6-6-3).
+#   - Para cada grupo se hace una BFS HACIA ATRÁS desde el objetivo en el
+#     espacio (posiciones del grupo, hueco): mover una pieza del grupo cuesta 1,
+#     mover cualquier otra pieza cuesta 0. Se guarda el mínimo sobre el hueco.
+#   - Como ningún movimiento se cuenta en dos grupos, la suma de los grupos
+#     sigue siendo admisible y domina a Manhattan.
+#
+# Formato del archivo (un byte por entrada):
+#   b"PDB1" | N | num_grupos | por grupo: k, piezas... | tablas concatenadas
+#   Cada tabla tiene 16**k bytes; el índice es sum(pos_i << 4*i).
+#
+# Construir:   python puzzle_pdb.py --partition 555 --out pdb555.bin
+# Usar:        python puzzle_busqueda_informada.py --algo idastar --pdb pdb555.bin
+# ------------------------------------------------------------
+
+import argparse, mmap, time
+
+# ===== 1) Parámetros del problema =====
+N = 4
+CELLS = N * N
+MAGIC = b"PDB1"
+
+# Particiones predefinidas (cubren las piezas 1..15 sin repetir)
+PARTITIONS = {
+    "555": [(1, 2, 5, 6, 9), (3, 4, 7, 8, 12), (10, 11, 13, 14, 15)],
+    "663": [(1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)],
+}
+
+# Vecinos de cada casilla (para mover el hueco)
+ADJ = []
+for _i in range(CELLS):
+    _r, _c = divmod(_i, N)
+    ADJ.append([_i + d for d, ok in ((-N, _r > 0), (N, _r < N-1), (-1, _c > 0), (1, _c < N-1)) if ok])
+
+# ===== 2) Construcción con BFS hacia atrás =====
+def build_group(tiles):
+    """
+    Regresa un bytearray de 16**k entradas con la distancia mínima (en movimientos
+    de piezas del grupo) de cada colocación de 'tiles' a su posición objetivo.
+    La BFS va por capas: dentro de una capa el hueco se mueve gratis (DFS con pila)
+    y los movimientos de piezas del grupo pasan a la siguiente capa.
+    """
+    k = len(tiles)
+    shift = 4 * k
+    mask = (1 << shift) - 1
+    table = bytearray(b"\xff") * (1 << shift)
+    seen = bytearray(1 << (shift + 4))    # estado = colocación | hueco << shift
+
+    start = sum((t - 1) << (4 * i) for i, t in enumerate(tiles))
+    frontier = [start | (CELLS - 1) << shift]  # en el objetivo el hueco va al final
+    d = 0
+    while frontier:
+        stack, nxt = frontier, []
+        while stack:
+            code = stack.pop()
+            if seen[code]:
+                continue
+            seen[code] = 1
+            cfg = code & mask
+            b = code >> shift
+            if table[cfg] == 255:         # las capas salen en orden: primera = mínima
+                table[cfg] = d
+            pos = [(cfg >> (4 * i)) & 15 for i in range(k)]
+            for nb in ADJ[b]:
+                if nb in pos:             # se mueve una pieza del grupo: cuesta 1
+                    j = pos.index(nb)
+                    ncode = (cfg + ((b - nb) << (4 * j))) | nb << shift
+                    if not seen[ncode]:
+                        nxt.append(ncode)
+                else:                     # se mueve otra pieza: cuesta 0
+                    ncode = cfg | nb << shift
+                    if not seen[ncode]:
+                        stack.append(ncode)
+        frontier = nxt
+        d += 1
+    return table
+
+def build(partition, out, verbose=True):
+    """Construye todos los grupos de 'partition' y los escribe en 'out'."""
+    tiles = sorted(t for g in partition for t in g)
+    if tiles != list(range(1, CELLS)):
+        raise ValueError("La partición debe cubrir las piezas 1..15 sin repetir.")
+    header = bytearray(MAGIC) + bytes([N, len(partition)])
+    for g in partition:
+        header += bytes([len(g)]) + bytes(g)
+    with open(out, "wb") as f:
+        f.write(header)
+        for g in partition:
+            t0 = time.time()
+            f.write(build_group(g))
+            if verbose:
+                print(f"grupo {g}: {16 ** len(g)} entradas en {time.time()-t0:.1f}s")
+
+# ===== 3) Lectura con mmap =====
+class PatternDatabase:
+    """
+    PDB aditiva mapeada en memoria (solo lectura). Varias instancias o procesos
+    que abran el mismo archivo comparten las páginas del sistema operativo.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mm[:4] != MAGIC or self.mm[4] != N:
+            raise ValueError(f"{path} no es una PDB de {N}x{N}.")
+        self.n = N             # lado del tablero para el que sirve
+        ngroups = self.mm[5]
+        p = 6
+        self.groups = []       # lista de tuplas de piezas
+        for _ in range(ngroups):
+            k = self.mm[p]
+            self.groups.append(tuple(self.mm[p+1:p+1+k]))
+            p += 1 + k
+        self.offsets = []      # desplazamiento de cada tabla dentro del archivo
+        for g in self.groups:
+            self.offsets.append(p)
+            p += 16 ** len(g)
+        # group_of[pieza] = (grupo, posición dentro del grupo)
+        self.group_of = [None] * CELLS
+        for gi, g in enumerate(self.groups):
+            for j, t in enumerate(g):
+                self.group_of[t] = (gi, j)
+
+    def indices(self, board):
+        """Índice de cada grupo para 'board' (sirve para actualizar incrementalmente)."""
+        ids = [0] * len(self.groups)
+        for i, t in enumerate(board):
+            if t != 0:
+                gi, j = self.group_of[t]
+                ids[gi] += i << (4 * j)
+        return ids
+
+    def value(self, ids):
+        """Suma de las tablas para los índices dados."""
+        mm = self.mm
+        return sum(mm[off + ix] for off, ix in zip(self.offsets, ids))
+
+    def distance(self, board):
+        """Heurística aditiva para un tablero (tupla de 16)."""
+        return self.value(self.indices(board))
+
+    def close(self):
+        self.mm.close()
+
+# ===== 4) CLI del constructor =====
+def main():
+    ap = argparse.ArgumentParser(description="Construye una PDB aditiva para el 15-puzzle")
+    ap.add_argument("--partition", default="555",
+                    help="555, 663 o grupos explícitos como '1,2,3,4,5/6,7,...'")
+    ap.add_argument("--out", required=True, help="Archivo de salida")
+    args = ap.parse_args()
+
+    if args.partition in PARTITIONS:
+        partition = PARTITIONS[args.partition]
+    else:
+        partition = [tuple(int(x) for x in g.split(",")) for g in args.partition.split("/")]
+    if max(len(g) for g in partition) > 6:
+        # 16**7 bytes por tabla (y 16**8 durante la BFS) ya no es práctico
+        raise SystemExit("Grupos de más de 6 piezas no están soportados.")
+    build(partition, args.out)
+
+if __name__ == "__main__":
+    main()
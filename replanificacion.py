@@ -0,0 +1,232 @@
+# ------------------------------------------------------------
+# Replanificación incremental en laberintos que cambian (D* Lite).
+#
+#   - Busca HACIA ATRÁS desde la salida: g(s) es la distancia de s a la
+#     salida y rhs(s) = min sobre vecinos (1 + g(vecino)). Un estado con
+#     g != rhs es "inconsistente" y está en la cola.
+#   - Al bloquear o liberar celdas solo se recalcula rhs de esas celdas y
+#     sus vecinos; la cola repara solo la región afectada y el resto de g
+#     se reusa. Si el inicio se mueve, km ajusta las llaves sin reordenar.
+#   - Cada reparación deja en 'ultima_reparacion' cuántos nodos expandió y
+#     cuántas celdas distintas tocó (g o rhs cambió), para compararlo con
+#     volver a correr a_estrella desde cero.
+#
+#   plan = DStarLite(laberinto, inicio, salida)     # formato de crear_laberinto
+#   camino = plan.camino()
+#   camino = plan.cambiar_celdas([((3, 4), True), ((7, 1), False)])
+#
+#   python replanificacion.py --filas 300 --columnas 300 --cambios 20 --rondas 5
+# ------------------------------------------------------------
+
+import argparse, heapq, random, time
+
+from Busqueda_informada import Rejilla, crear_laberinto, a_estrella_rejilla
+
+INF = float("inf")
+
+class DStarLite:
+    """
+    D* Lite sobre una copia propia de la rejilla (4 vecinos, costo 1).
+    'laberinto' puede ser el formato de crear_laberinto o una Rejilla.
+    """
+    def __init__(self, laberinto, inicio, salida):
+        if isinstance(laberinto, Rejilla):
+            rejilla = Rejilla(laberinto.filas, laberinto.columnas, bytearray(laberinto.celdas))
+        else:
+            rejilla = Rejilla.desde_lista(laberinto)
+        self.rejilla = rejilla
+        self.ancho = ancho = rejilla.ancho
+        self.pasos = (1, -1, ancho, -ancho)
+        self.inicio = rejilla.indice(inicio)
+        self.salida = rejilla.indice(salida)
+        self.g, self.rhs = {}, {}      # sin entrada = infinito
+        self.cola = []                 # heap de (k1, k2, índice) con borrado perezoso
+        self.en_cola = {}              # índice -> llave vigente
+        self.km = 0
+        self.ultima_reparacion = None
+        self._tocados = set()
+        self._expandidos = 0
+        self.rhs[self.salida] = 0
+        self._meter(self.salida)
+        self._calcular()
+
+    # ----- utilidades -----
+    def _h(self, i):
+        """Manhattan desde el inicio actual hasta i."""
+        a, b = divmod(i, self.ancho)
+        c, d = divmod(self.inicio, self.ancho)
+        return abs(a - c) + abs(b - d)
+
+    def _llave(self, i):
+        m = min(self.g.get(i, INF), self.rhs.get(i, INF))
+        return (m + self._h(i) + self.km, m)
+
+    def _meter(self, i):
+        k = self._llave(i)
+        self.en_cola[i] = k
+        heapq.heappush(self.cola, (k[0], k[1], i))
+
+    def _tope(self):
+        """Llave mínima vigente de la cola (descarta entradas viejas)."""
+        cola = self.cola
+        while cola:
+            k1, k2, i = cola[0]
+            if self.en_cola.get(i) == (k1, k2):
+                return (k1, k2), i
+            heapq.heappop(cola)
+        return (INF, INF), None
+
+    def _rhs_desde_vecinos(self, i):
+        """rhs(i) = min(1 + g(vecino)) sobre vecinos libres (inf si i es pared)."""
+        celdas = self.rejilla.celdas
+        if celdas[i]:
+            return INF
+        g = self.g
+        return min((1 + g.get(i + d, INF) for d in self.pasos if not celdas[i + d]),
+                   default=INF)
+
+    def _actualizar(self, i):
+        self._tocados.add(i)
+        if self.g.get(i, INF) != self.rhs.get(i, INF):
+            self._meter(i)
+        else:
+            self.en_cola.pop(i, None)
+
+    def _calcular(self):
+        """ComputeShortestPath: procesa la cola hasta que el inicio sea consistente."""
+        g, rhs, celdas = self.g, self.rhs, self.rejilla.celdas
+        while True:
+            k_viejo, u = self._tope()
+            if u is None:
+                break
+            ini = self.inicio
+            if not (k_viejo < self._llave(ini) or rhs.get(ini, INF) > g.get(ini, INF)):
+                break
+            k_nuevo = self._llave(u)
+            if k_viejo < k_nuevo:          # la llave subió por km: reinsertar
+                self._meter(u)
+                continue
+            self._expandidos += 1
+            del self.en_cola[u]
+            gu, ru = g.get(u, INF), rhs.get(u, INF)
+            if gu > ru:                    # se vuelve consistente (mejoró)
+                g[u] = ru
+                self._tocados.add(u)
+                for d in self.pasos:
+                    s = u + d
+                    if not celdas[s] and s != self.salida and 1 + ru < rhs.get(s, INF):
+                        rhs[s] = 1 + ru
+                        self._actualizar(s)
+            else:                          # empeoró: se invalida y se recalculan vecinos
+                g.pop(u, None)
+                self._tocados.add(u)
+                self._actualizar(u)
+                for d in self.pasos:
+                    s = u + d
+                    if celdas[s] or s == self.salida:
+                        continue
+                    if rhs.get(s, INF) == 1 + gu:   # dependía de u
+                        rhs[s] = self._rhs_desde_vecinos(s)
+                    self._actualizar(s)
+
+    # ----- interfaz -----
+    def camino(self):
+        """Camino más corto actual como lista de (fila, columna), o None."""
+        g, celdas = self.g, self.rejilla.celdas
+        i = self.inicio
+        if self.rhs.get(i, INF) == INF:   # rhs(inicio) ya es la distancia final
+            return None
+        camino = [self.rejilla.posicion(i)]
+        while i != self.salida:
+            # el vecino libre con menor g (baja exactamente 1 en cada paso)
+            i = min((i + d for d in self.pasos if not celdas[i + d]),
+                    key=lambda s: g.get(s, INF), default=None)
+            if i is None or g.get(i, INF) == INF:
+                return None
+            camino.append(self.rejilla.posicion(i))
+        return camino
+
+    def cambiar_celdas(self, cambios):
+        """
+        Aplica un lote de cambios [((fila, columna), bloqueada), ...] y repara
+        el camino. Regresa el camino nuevo (o None si ya no hay salida).
+        """
+        t0 = time.perf_counter()
+        self._tocados = set()
+        self._expandidos = 0
+        celdas = self.rejilla.celdas
+        afectadas = set()
+        for pos, bloqueada in cambios:
+            i = self.rejilla.indice(pos)
+            if i in (self.inicio, self.salida) and bloqueada:
+                raise ValueError(f"No se puede bloquear el inicio ni la salida {pos}.")
+            if celdas[i] != bool(bloqueada):
+                celdas[i] = 1 if bloqueada else 0
+                afectadas.add(i)
+                afectadas.update(i + d for d in self.pasos)
+        for s in afectadas:
+            if s != self.salida:
+                self.rhs[s] = self._rhs_desde_vecinos(s)
+            if celdas[s]:
+                self.g.pop(s, None)
+            self._actualizar(s)
+        self._calcular()
+        self.ultima_reparacion = dict(cambios=len(cambios), expandidos=self._expandidos,
+                                      tocados=len(self._tocados),
+                                      tiempo=time.perf_counter() - t0)
+        return self.camino()
+
+    def mover_inicio(self, pos):
+        """El agente avanzó: nuevo inicio (las llaves viejas siguen sirviendo con km)."""
+        nuevo = self.rejilla.indice(pos)
+        self.km += self._h(nuevo)      # distancia del inicio viejo al nuevo
+        self.inicio = nuevo
+        self._calcular()
+
+# ===== Demostración: reparar contra volver a buscar =====
+def main():
+    ap = argparse.ArgumentParser(description="D* Lite: replanificar mientras el laberinto cambia")
+    ap.add_argument("--filas", type=int, default=200)
+    ap.add_argument("--columnas", type=int, default=200)
+    ap.add_argument("--densidad", type=float, default=0.25)
+    ap.add_argument("--cambios", type=int, default=10, help="Celdas que cambian por ronda")
+    ap.add_argument("--rondas", type=int, default=5)
+    ap.add_argument("--semilla", type=int, default=None)
+    args = ap.parse_args()
+
+    random.seed(args.semilla)
+    laberinto, inicio, salida = crear_laberinto(args.filas, args.columnas, args.densidad)
+    t0 = time.perf_counter()
+    plan = DStarLite(laberinto, inicio, salida)
+    camino = plan.camino()
+    print(f"Plan inicial: {'sin camino' if camino is None else len(camino) - 1} "
+          f"({time.perf_counter() - t0:.3f}s)")
+
+    from instrumentacion import Observador
+    for r in range(args.rondas):
+        # La mitad de los cambios bloquea celdas del camino actual (lo que obliga a reparar)
+        cambios = []
+        libres = [p for p in (camino or [])[1:-1]]
+        for k in range(args.cambios):
+            if k % 2 == 0 and libres:
+                cambios.append((random.choice(libres), True))
+            else:
+                pos = (random.randrange(args.filas), random.randrange(args.columnas))
+                if pos not in (inicio, salida):
+                    cambios.append((pos, random.random() < 0.5))
+        camino = plan.cambiar_celdas(cambios)
+        rep = plan.ultima_reparacion
+
+        # Comparación: A* desde cero sobre el laberinto ya modificado
+        obs = Observador()
+        t1 = time.perf_counter()
+        otro = a_estrella_rejilla(plan.rejilla, inicio, salida, obs=obs)
+        t_completo = time.perf_counter() - t1
+        largo = None if camino is None else len(camino) - 1
+        assert largo == (None if otro is None else len(otro) - 1)
+        print(f"Ronda {r + 1}: camino={largo}  reparación: {rep['expandidos']} expandidos, "
+              f"{rep['tocados']} tocados, {rep['tiempo'] * 1000:.1f}ms  |  "
+              f"A* completo: {obs.totales['expandidos']} expandidos, {t_completo * 1000:.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+# ------------------------------------------------------------
+# Servicio de resolución de larga vida (asyncio, JSON por línea).
+#
+#   - Un pool de procesos "calientes" ya tiene importados los resolutores
+#     (y la PDB, los laberintos LAB1 abiertos...), así que una petición no
+#     paga el arranque del intérprete.
+#   - Peticiones idénticas en vuelo se juntan en un solo cálculo.
+#   - Cada petición tiene fecha límite; si vence y nadie más espera ese
+#     cálculo, se MATA al proceso que lo corre y se arranca otro.
+#   - Contrapresión: a lo más 'max_en_vuelo' peticiones a la vez; mientras
+#     tanto no se lee más de los clientes.
+#
+# Peticiones (una línea JSON cada una; 'id' se regresa tal cual):
+#   {"id": 1, "kind": "puzzle", "algo": "idastar", "start": [1, 2, ..., 0], "deadline": 5}
+#   {"id": 2, "kind": "maze", "algo": "jps", "archivo": "lab.bin"}
+#   {"id": 3, "kind": "maze", "algo": "a_estrella",
+#    "generar": {"filas": 500, "columnas": 500, "densidad": 0.3, "semilla": 1}}
+#   {"id": 4, "kind": "maze", "laberinto": ["0010", "0000"], "inicio": [0, 0], "salida": [1, 3]}
+# Respuestas: {"id": ..., "status": "ok" | "not_found" | "unsolvable" |
+#              "timeout" | "error", "shared": true si se juntó con otra, ...}
+#
+#   python servicio.py --stdio                 (stdin/stdout)
+#   python servicio.py --stdio < peticiones.jsonl > respuestas.jsonl
+#   python servicio.py --port 8765             (TCP en 127.0.0.1)
+#   python servicio.py --unix /tmp/servicio.sock
+# ------------------------------------------------------------
+
+import argparse, asyncio, json, multiprocessing, os, stat, sys
+
+# ===== 1) Lado del proceso trabajador =====
+def _resolver(job, pdb, rejillas):
+    """Corre una petición ya validada dentro del trabajador."""
+    import puzzle, puzzle_batch
+    import Busqueda_informada as bi
+    from laberinto_archivo import cargar_rejilla, generar_rejilla
+
+    if job["kind"] == "puzzle":
+        state = puzzle.parse_state(" ".join(str(x) for x in job["start"]))
+        if not puzzle.is_solvable(state):
+            return dict(status="unsolvable")
+        res = puzzle_batch.solve(state, job.get("algo", "idastar"), job.get("max_depth"),
+                                 pdb=pdb if len(state) == 16 else None)
+        out = dict(status="ok" if res["path"] is not None else "not_found",
+                   label=res["algo"], expanded=res["expanded"], time=res["time"])
+        if res["path"] is not None:
+            out.update(length=len(res["path"]), path="".join(res["path"]))
+        return out
+
+    # Laberinto: archivo LAB1, generado con semilla o dado como lista de filas
+    inicio = salida = None
+    if "archivo" in job:
+        clave = ("archivo", job["archivo"])
+        if clave not in rejillas:
+            rejillas[clave] = cargar_rejilla(job["archivo"])
+        rejilla = rejillas[clave]
+    elif "generar" in job:
+        g = job["generar"]
+        clave = ("generar", g["filas"], g["columnas"], g.get("densidad", 0.3), g.get("semilla"))
+        if clave not in rejillas:
+            rejillas[clave] = generar_rejilla(*clave[1:])[0]
+        rejilla = rejillas[clave]
+    else:
+        rejilla = bi.Rejilla.desde_lista(job["laberinto"])
+    inicio = tuple(job.get("inicio", (0, 0)))
+    salida = tuple(job.get("salida", (rejilla.filas - 1, rejilla.columnas - 1)))
+    for nombre, pos in (("inicio", inicio), ("salida", salida)):
+        if (len(pos) != 2 or not all(isinstance(x, int) for x in pos)
+                or not (0 <= pos[0] < rejilla.filas and 0 <= pos[1] < rejilla.columnas)):
+            raise ValueError(f"'{nombre}' fuera del laberinto: {list(pos)}")
+        if rejilla.es_obstaculo(pos):
+            raise ValueError(f"'{nombre}' cae en una pared: {list(pos)}")
+    buscar = bi.jps_rejilla if job.get("algo") == "jps" else bi.a_estrella_rejilla
+    camino = buscar(rejilla, inicio, salida)
+    if camino is None:
+        return dict(status="not_found")
+    return dict(status="ok", length=len(camino) - 1, path=[list(p) for p in camino])
+
+def _trabajador(conn, pdb_path):
+    """Ciclo de un proceso del pool: recibe trabajos por el Pipe y contesta."""
+    # Importar todo de una vez: es lo que hace "caliente" al proceso
+    import puzzle, puzzle_batch, Busqueda_informada, laberinto_archivo
+    pdb = None
+    if pdb_path:
+        from puzzle_pdb import PatternDatabase
+        pdb = PatternDatabase(pdb_path)
+    rejillas = {}   # laberintos ya cargados/generados en este proceso
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        try:
+            res = _resolver(job, pdb, rejillas)
+        except Exception as e:   # la petición falla, el proceso sigue vivo
+            res = dict(status="error", error=f"{type(e).__name__}: {e}")
+        conn.send(res)
+
+# ===== 2) Pool de procesos que se pueden matar =====
+class PoolCaliente:
+    """
+    'procesos' trabajadores, cada uno con su Pipe. ejecutar() toma uno libre;
+    si la tarea se cancela mientras corre, el trabajador se mata y se
+    reemplaza por uno nuevo (la cancelación sí detiene el cálculo).
+    """
+    def __init__(self, procesos, pdb_path=None):
+        self.ctx = multiprocessing.get_context("spawn")
+        self.pdb_path = pdb_path
+        self.libres = asyncio.Queue()
+        self.todos = set()
+        for _ in range(procesos):
+            self.libres.put_nowait(self._nuevo())
+
+    def _nuevo(self):
+        conn, hijo = self.ctx.Pipe()
+        p = self.ctx.Process(target=_trabajador, args=(hijo, self.pdb_path), daemon=True)
+        p.start()
+        hijo.close()
+        w = (p, conn)
+        self.todos.add(w)
+        return w
+
+    def _matar(self, w):
+        p, conn = w
+        self.todos.discard(w)
+        p.kill()
+        p.join()
+        conn.close()
+
+    async def ejecutar(self, job):
+        w = await self.libres.get()
+        p, conn = w
+        loop = asyncio.get_running_loop()
+        listo = loop.create_future()
+        loop.add_reader(conn.fileno(), lambda: listo.done() or listo.set_result(None))
+        try:
+            conn.send(job)
+            await listo
+            res = conn.recv()
+        except asyncio.CancelledError:
+            loop.remove_reader(conn.fileno())
+            self._matar(w)
+            self.libres.put_nowait(self._nuevo())
+            raise
+        except (EOFError, OSError):  # el trabajador se cayó (p. ej. sin memoria)
+            loop.remove_reader(conn.fileno())
+            self._matar(w)
+            self.libres.put_nowait(self._nuevo())
+            return dict(status="error", error="el proceso trabajador terminó")
+        loop.remove_reader(conn.fileno())
+        self.libres.put_nowait(w)
+        return res
+
+    def cerrar(self):
+        for w in list(self.todos):
+            self._matar(w)
+
+# ===== 3) Servicio: validación, juntar peticiones, fechas límite =====
+class Servicio:
+    """
+    - max_en_vuelo: peticiones atendiéndose a la vez (contrapresión)
+    - deadline    : segundos por defecto si la petición no trae 'deadline'
+    """
+    def __init__(self, pool, max_en_vuelo=64, deadline=30.0):
+        self.pool = pool
+        self.cupo = asyncio.Semaphore(max_en_vuelo)
+        self.deadline = deadline
+        self.en_vuelo = {}   # clave -> [tarea, cuántas peticiones la esperan]
+
+    @staticmethod
+    def _validar(pet):
+        """Regresa el trabajo (sin 'id' ni 'deadline') o lanza ValueError."""
+        kind = pet.get("kind")
+        if kind == "puzzle":
+            if not isinstance(pet.get("start"), list):
+                raise ValueError("'start' debe ser una lista de números")
+            if pet.get("algo", "idastar") not in ("bfs", "iddfs", "bibfs", "astar",
+                                                  "idastar", "arastar"):
+                raise ValueError(f"algoritmo desconocido: {pet.get('algo')}")
+        elif kind == "maze":
+            if not any(k in pet for k in ("archivo", "generar", "laberinto")):
+                raise ValueError("falta 'archivo', 'generar' o 'laberinto'")
+            if pet.get("algo", "a_estrella") not in ("a_estrella", "jps"):
+                raise ValueError(f"algoritmo desconocido: {pet.get('algo')}")
+        else:
+            raise ValueError("'kind' debe ser 'puzzle' o 'maze'")
+        if "deadline" in pet:
+            d = pet["deadline"]
+            if isinstance(d, bool) or not isinstance(d, (int, float)) or not 0 < d < float("inf"):
+                raise ValueError("'deadline' debe ser un número positivo de segundos")
+        return {k: v for k, v in pet.items() if k not in ("id", "deadline")}
+
+    async def atender(self, pet):
+        """Resuelve una petición (dict) y regresa la respuesta (dict)."""
+        try:
+            job = self._validar(pet)
+        except ValueError as e:
+            return dict(status="error", error=str(e), shared=False)
+        clave = json.dumps(job, sort_keys=True)
+        entrada = self.en_vuelo.get(clave)
+        compartida = entrada is not None and not entrada[0].cancelled()
+        if not compartida:
+            entrada = [asyncio.ensure_future(self.pool.ejecutar(job)), 0]
+            self.en_vuelo[clave] = entrada
+            def quitar(_, entrada=entrada):
+                if self.en_vuelo.get(clave) is entrada:
+                    del self.en_vuelo[clave]
+            entrada[0].add_done_callback(quitar)
+        entrada[1] += 1
+        try:
+            res = await asyncio.wait_for(asyncio.shield(entrada[0]),
+                                         pet.get("deadline", self.deadline))
+            res = dict(res)
+        except asyncio.TimeoutError:
+            res = dict(status="timeout")
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise                      # nos cancelaron a nosotros (cierre)
+            res = dict(status="timeout")   # el cálculo compartido se canceló
+        finally:
+            entrada[1] -= 1
+            if entrada[1] == 0 and not entrada[0].done():
+                entrada[0].cancel()          # nadie más la espera: matar el cálculo
+        res["shared"] = compartida
+        return res
+
+    async def _una(self, linea, writer, candado):
+        try:
+            pet = json.loads(linea)
+            if not isinstance(pet, dict):
+                raise ValueError
+        except ValueError:
+            res = dict(id=None, status="error", error="JSON inválido", shared=False)
+        else:
+            try:
+                res = dict(id=pet.get("id"), **await self.atender(pet))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:   # cada petición recibe exactamente una respuesta
+                res = dict(id=pet.get("id"), status="error",
+                           error=f"{type(e).__name__}: {e}", shared=False)
+        async with candado:
+            writer.write((json.dumps(res) + "\n").encode())
+            await writer.drain()
+
+    async def conexion(self, reader, writer):
+        """Atiende un cliente: lee peticiones mientras haya cupo."""
+        candado = asyncio.Lock()   # una respuesta completa a la vez
+        tareas = set()
+        while True:
+            await self.cupo.acquire()
+            linea = await reader.readline()
+            if not linea:
+                self.cupo.release()
+                break
+            if not linea.strip():
+                self.cupo.release()
+                continue
+            t = asyncio.ensure_future(self._una(linea, writer, candado))
+            tareas.add(t)
+            t.add_done_callback(tareas.discard)
+            t.add_done_callback(lambda _: self.cupo.release())
+        if tareas:
+            await asyncio.gather(*tareas)
+        writer.close()
+
+# ===== 4) Arranque =====
+def _es_tubo(fd):
+    """True si fd es tubería, socket o terminal (lo que aceptan los transportes de asyncio)."""
+    modo = os.fstat(fd).st_mode
+    return stat.S_ISFIFO(modo) or stat.S_ISSOCK(modo) or stat.S_ISCHR(modo)
+
+class _EscritorArchivo:
+    """Lo mínimo de StreamWriter para cuando stdout es un archivo normal."""
+    def write(self, datos):
+        sys.stdout.buffer.write(datos)
+
+    async def drain(self):
+        sys.stdout.buffer.flush()
+
+    def close(self):
+        sys.stdout.buffer.flush()
+
+async def _leer_en_hilo(reader):
+    """Pasa stdin (un archivo normal) al StreamReader leyendo en un hilo."""
+    loop = asyncio.get_running_loop()
+    while True:
+        linea = await loop.run_in_executor(None, sys.stdin.buffer.readline)
+        if not linea:
+            reader.feed_eof()
+            return
+        reader.feed_data(linea)
+
+async def _stdio(servicio):
+    """
+    Conecta stdin/stdout como si fueran un cliente más. Los transportes de
+    asyncio solo sirven con tuberías y sockets; si stdin o stdout es un
+    archivo normal (--stdio < peticiones.jsonl) se lee en un hilo y se
+    escribe directo.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    lector = None
+    if _es_tubo(0):
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    else:
+        lector = asyncio.ensure_future(_leer_en_hilo(reader))
+    if _es_tubo(1):
+        transporte, protocolo = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin,
+                                                              sys.stdout)
+        writer = asyncio.StreamWriter(transporte, protocolo, reader, loop)
+    else:
+        writer = _EscritorArchivo()
+    await servicio.conexion(reader, writer)
+    if lector is not None:
+        await lector
+
+async def servir(args):
+    pool = PoolCaliente(args.workers, args.pdb)
+    servicio = Servicio(pool, args.max_in_flight, args.deadline)
+    try:
+        if args.stdio:
+            await _stdio(servicio)
+            return
+        if args.unix:
+            server = await asyncio.start_unix_server(servicio.conexion, args.unix)
+        else:
+            server = await asyncio.start_server(servicio.conexion, "127.0.0.1", args.port)
+        print(f"Escuchando en {args.unix or f'127.0.0.1:{args.port}'} "
+              f"({args.workers} procesos)", file=sys.stderr, flush=True)
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.cerrar()
+
+def main():
+    ap = argparse.ArgumentParser(description="Servicio de resolución (puzzle y laberintos)")
+    donde = ap.add_mutually_exclusive_group(required=True)
+    donde.add_argument("--stdio", action="store_true", help="Peticiones por stdin, respuestas por stdout")
+    donde.add_argument("--port", type=int, help="Puerto TCP en 127.0.0.1")
+    donde.add_argument("--unix", type=str, help="Ruta de un socket Unix")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="Procesos calientes en el pool")
+    ap.add_argument("--max-in-flight", type=int, default=64,
+                    help="Peticiones atendiéndose a la vez antes de dejar de leer")
+    ap.add_argument("--deadline", type=float, default=30.0,
+                    help="Segundos por petición si no trae 'deadline'")
+    ap.add_argument("--pdb", type=str, default=None, help="PDB de puzzle_pdb.py para el puzzle 4x4")
+    args = ap.parse_args()
+    try:
+        asyncio.run(servir(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()